@@ -1,14 +1,16 @@
 import argparse
 import yaml
 import os
+import sys
 import logging
 import shutil
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
 
 from dataqe_framework import __version__
 from dataqe_framework.executor import ValidationExecutor
-from dataqe_framework.config_loader import load_config
+from dataqe_framework.config_loader import load_config, compile_config, file_cache_key, load_yaml_file
 from dataqe_framework.reporter import (
     ExecutionSummary,
     ExecutionMetadata,
@@ -27,6 +29,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parsed test scripts keyed on (path, mtime, size), before variable replacement
+_TEST_CASES_CACHE = {}
+
 
 def parse_replacements(replace_args: list) -> dict:
     """
@@ -114,13 +119,17 @@ def load_test_cases(script_path: str, replacements: dict = None):
         replacements: Optional dictionary of variables to replace
 
     Returns:
-        dict: Test cases with replacements applied
+        dict: Test cases with replacements applied. The structure is rebuilt by
+        apply_replacements, so callers may mutate it without touching the cache.
     """
     if not os.path.exists(script_path):
         raise FileNotFoundError(f"Test script not found: {script_path}")
 
-    with open(script_path, "r") as file:
-        test_cases = yaml.safe_load(file)
+    cache_key = file_cache_key(script_path)
+    test_cases = _TEST_CASES_CACHE.get(cache_key)
+    if test_cases is None:
+        test_cases = load_yaml_file(script_path)
+        _TEST_CASES_CACHE[cache_key] = test_cases
 
     if replacements is None:
         replacements = {}
@@ -171,22 +180,50 @@ def clean_output_directory(output_dir: str) -> None:
     Args:
         output_dir: Path to output directory to clean
     """
-    output_path = Path(output_dir)
-    if output_path.exists():
-        try:
-            for file in output_path.glob("*"):
-                if file.is_file():
-                    file.unlink()
-            logger.info(f"Cleaned output directory: {output_dir}")
-        except Exception as e:
-            logger.warning(f"Error cleaning output directory: {e}")
+    _remove_files(output_dir)
+
+
+def prepare_output_directory(output_dir: str) -> None:
+    """
+    Ensure output directory exists and remove files left by a previous run.
+
+    Equivalent to ensure_output_directory() followed by clean_output_directory(),
+    without checking for existence a second time. Subdirectories are preserved.
+
+    Args:
+        output_dir: Path to output directory to create and clean
+    """
+    ensure_output_directory(output_dir)
+    _remove_files(output_dir)
+
+
+def _remove_files(output_dir: str) -> None:
+    """Remove all files directly inside output_dir, leaving subdirectories."""
+    try:
+        # scandir entries carry the file type from the directory listing, so
+        # only symlinks need a stat (to check whether they point at a file)
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        # Already removed by someone else; keep cleaning the rest
+                        continue
+        logger.info(f"Cleaned output directory: {output_dir}")
+    except FileNotFoundError:
+        # Output directory is missing, so there is nothing to clean; avoids a
+        # separate existence check up front
+        return
+    except Exception as e:
+        logger.warning(f"Error cleaning output directory: {e}")
 
 
 def is_valid_block(block_config):
     """
     Check if a configuration block has the required structure.
 
-    A valid block must have 'source', 'target', and 'other' keys that are all dicts.
+    A valid block must have 'source', 'target', and 'other' keys that are all mappings.
 
     Args:
         block_config: Configuration block to validate
@@ -194,13 +231,13 @@ def is_valid_block(block_config):
     Returns:
         bool: True if block has required structure, False otherwise
     """
-    if not isinstance(block_config, dict):
+    if not isinstance(block_config, Mapping):
         return False
 
     return (
-        "source" in block_config and isinstance(block_config["source"], dict) and
-        "target" in block_config and isinstance(block_config["target"], dict) and
-        "other" in block_config and isinstance(block_config["other"], dict)
+        "source" in block_config and isinstance(block_config["source"], Mapping) and
+        "target" in block_config and isinstance(block_config["target"], Mapping) and
+        "other" in block_config and isinstance(block_config["other"], Mapping)
     )
 
 
@@ -267,15 +304,15 @@ def get_first_block(full_config: dict) -> tuple:
     Raises:
         ValueError: If no valid blocks found
     """
-    blocks = get_all_blocks(full_config)
-    if not blocks:
-        raise ValueError(
-            "No valid configuration blocks found in config file.\n"
-            "A valid block must have 'source', 'target', and 'other' keys."
-        )
-
-    first_name = next(iter(blocks.keys()))
-    return (first_name, blocks[first_name])
+    # Stop at the first valid block rather than validating every block
+    for block_name, block_config in full_config.items():
+        if is_valid_block(block_config):
+            return (block_name, block_config)
+
+    raise ValueError(
+        "No valid configuration blocks found in config file.\n"
+        "A valid block must have 'source', 'target', and 'other' keys."
+    )
 
 
 def save_invalid_tests(output_dir: str, failed_test_names: list) -> str:
@@ -345,9 +382,9 @@ def filter_test_cases_by_invalid_list(test_cases: list, invalid_test_names: list
 
     marked_count = 0
     for test in test_cases:
-        test_name = list(test.keys())[0]
+        test_name, test_config = next(iter(test.items()))
         if test_name in invalid_test_names:
-            test[test_name]["invalid"] = True
+            test_config["invalid"] = True
             marked_count += 1
 
     return test_cases, marked_count
@@ -412,13 +449,22 @@ def execute_block(block_name: str, block_config: dict, config_path: str, output_
                 f"Config key: 'preprocessor_queries' in block '{block_name}'"
             )
 
+    # Overlap source and target queries unless the block opts out
+    parallel_io = block_config["other"].get("parallel_io", True)
+    if not isinstance(parallel_io, bool):
+        raise ValueError(
+            f"Invalid 'parallel_io' value {parallel_io!r} in block '{block_name}'.\n"
+            f"Use an unquoted true or false."
+        )
+
     # Execute tests with timing
     logger.info(f"Starting execution of block: {block_name} (script: {script_name})")
     executor = ValidationExecutor(
         source_config,
         target_config,
         test_cases,
-        preprocessor_queries_path=preprocessor_queries_path
+        preprocessor_queries_path=preprocessor_queries_path,
+        parallel_io=parallel_io
     )
     results = executor.run(script_name=script_name)
 
@@ -497,8 +543,7 @@ def main():
 
     # Get output directory, create if needed, and clean it
     output_dir = get_output_dir(args.output_dir)
-    ensure_output_directory(output_dir)
-    clean_output_directory(output_dir)
+    prepare_output_directory(output_dir)
 
     # Load invalid tests list if flag is set
     invalid_test_names = []
@@ -624,3 +669,23 @@ def main():
             f"Next run: Use --load-invalid-list flag to automatically skip these {len(error_test_names)} tests"
         )
 
+
+def compile_main():
+    """Entry point for dataqe-compile: precompile a config file for faster loading."""
+    parser = argparse.ArgumentParser(
+        description="Precompile a DataQE configuration YAML file so dataqe-run can skip YAML parsing"
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument(
+        "--config",
+        required=True,
+        help="Path to configuration YAML file (compiled to <config>.compiled, which dataqe-run picks up automatically)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        compile_config(args.config)
+    except (FileNotFoundError, ValueError) as e:
+        logger.error("Failed to compile config: %s", e)
+        sys.exit(1)
@@ -1,8 +1,29 @@
-import re
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
+# fastnumbers converts numeric strings in C without the generic float() dispatch
+try:
+    from fastnumbers import fast_float as _to_float
+except ImportError:
+    _to_float = float
+
+# Operators accepted by _parse_expected_condition, split by length so that
+# two-character operators are matched before their one-character prefixes
+_TWO_CHAR_OPERATORS = frozenset(("<=", ">=", "==", "!="))
+_ONE_CHAR_OPERATORS = frozenset(("<", ">"))
+
+
+def _is_plain_number(text):
+    """Return True if text is an optionally negative integer or decimal, e.g. "-2.5"."""
+    if text[:1] == "-":
+        text = text[1:]
+    int_part, dot, frac_part = text.partition(".")
+    if not int_part.isdecimal():
+        return False
+    return not dot or frac_part.isdecimal()
+
 
 def _parse_expected_condition(expected_str):
     """
@@ -17,15 +38,28 @@ def _parse_expected_condition(expected_str):
     if not isinstance(expected_str, str):
         return None, None
 
+    return _parse_condition_text(expected_str)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_condition_text(expected_str):
+    """Cached parser behind _parse_expected_condition; expected_str must be a str."""
+    text = expected_str.strip()
+
     # Match operators: <=, >=, ==, !=, <, >
-    match = re.match(r'^(<=|>=|==|!=|<|>)\s*(-?\d+(?:\.\d+)?)\s*$', expected_str.strip())
+    if text[:2] in _TWO_CHAR_OPERATORS:
+        operator = text[:2]
+    elif text[:1] in _ONE_CHAR_OPERATORS:
+        operator = text[:1]
+    else:
+        return None, None
 
-    if match:
-        operator = match.group(1)
-        value = float(match.group(2))
-        return operator, value
+    number = text[len(operator):].lstrip()
+    if not _is_plain_number(number):
+        return None, None
 
-    return None, None
+    # The shape was validated above, so the conversion cannot fail
+    return operator, _to_float(number)
 
 
 def _apply_operator(value, operator, threshold):
@@ -70,6 +104,9 @@ def compare_values(source_value, target_value, test_config):
     3. Source vs target with threshold (percentage, absolute)
     4. Source vs target with condition operator
 
+    Callers comparing many value pairs under the same test should use
+    build_comparator() once and call the returned function instead.
+
     Args:
         source_value: Value from source query
         target_value: Value from target query (can be None for source-only tests)
@@ -81,82 +118,238 @@ def compare_values(source_value, target_value, test_config):
     Returns:
         "PASS" or "FAIL"
     """
-    comparisons = test_config.get("comparisons", {})
-    source_config = test_config.get("source", {})
-
     # Source-only test (no target)
     if target_value is None:
-        expected = source_config.get("expected")
-
         # Check if expected is a condition like "<=2"
-        operator, threshold = _parse_expected_condition(expected)
-
+        operator, threshold = _parse_expected_condition((test_config.get("source") or {}).get("expected"))
         if operator and threshold is not None:
-            # Condition-based comparison
-            if _apply_operator(source_value, operator, threshold):
-                logger.debug(f"Source value {source_value} {operator} {threshold}: PASS")
-                return "PASS"
-            else:
-                logger.debug(f"Source value {source_value} {operator} {threshold}: FAIL")
-                return "FAIL"
-        else:
-            # Backward compatibility: if no condition, check if source is truthy
-            return "PASS" if source_value else "FAIL"
+            return _compare_source_condition(source_value, operator, threshold)
+        # Backward compatibility: if no condition, check if source is truthy
+        return "PASS" if source_value else "FAIL"
 
     # Source and target comparison
     if source_value == target_value:
         return "PASS"
 
     # Check threshold-based comparison
-    threshold = comparisons.get("threshold")
+    threshold = (test_config.get("comparisons") or {}).get("threshold")
+    if not threshold:
+        return "FAIL"
 
-    if threshold:
+    threshold_value = threshold.get("value")
+    if not threshold_value:
+        # Condition-based threshold (e.g., condition: ">")
         condition = threshold.get("condition")
-        threshold_value = threshold.get("value")
-        threshold_limit = threshold.get("limit")
+        if condition:
+            return _compare_threshold_condition(source_value, target_value, condition)
+        return "FAIL"
+
+    threshold_limit = threshold.get("limit")
+    if threshold_limit is None:
+        return "FAIL"
+    if threshold_value == "percentage":
+        return _compare_percentage(source_value, target_value, threshold_limit)
+    if threshold_value == "absolute":
+        return _compare_absolute(source_value, target_value, threshold_limit)
 
-        # Condition-based threshold (e.g., condition: ">")
-        # When condition is specified, FAIL if the condition IS TRUE
-        if condition and not threshold_value:
-            if _apply_operator(source_value, condition, target_value):
-                logger.debug(f"Source {source_value} {condition} Target {target_value}: FAIL")
-                return "FAIL"
-            else:
-                logger.debug(f"Source {source_value} {condition} Target {target_value}: PASS")
-                return "PASS"
-
-        # Percentage-based threshold
-        if threshold_value == "percentage" and threshold_limit is not None:
-            try:
-                if target_value == 0:
-                    # Can't calculate percentage when target is 0
-                    return "FAIL" if source_value != target_value else "PASS"
-
-                percentage_diff = abs((source_value - target_value) / target_value) * 100
-                if percentage_diff > threshold_limit:
-                    logger.debug(f"Percentage diff {percentage_diff}% > limit {threshold_limit}%: FAIL")
-                    return "FAIL"
-                else:
-                    logger.debug(f"Percentage diff {percentage_diff}% <= limit {threshold_limit}%: PASS")
-                    return "PASS"
-            except (TypeError, ValueError):
-                logger.warning(f"Cannot calculate percentage threshold for {source_value} vs {target_value}")
-                return "FAIL"
-
-        # Absolute threshold
-        if threshold_value == "absolute" and threshold_limit is not None:
-            try:
-                absolute_diff = abs(source_value - target_value)
-                if absolute_diff > threshold_limit:
-                    logger.debug(f"Absolute diff {absolute_diff} > limit {threshold_limit}: FAIL")
-                    return "FAIL"
-                else:
-                    logger.debug(f"Absolute diff {absolute_diff} <= limit {threshold_limit}: PASS")
-                    return "PASS"
-            except (TypeError, ValueError):
-                logger.warning(f"Cannot calculate absolute threshold for {source_value} vs {target_value}")
-                return "FAIL"
-
-    # Default: if values don't match and no threshold passes, FAIL
     return "FAIL"
 
+
+def compare_values_batch(source_values, target_values, test_config):
+    """
+    Compare sequences of source and target values pairwise under one test.
+
+    Percentage and absolute thresholds are evaluated with NumPy in a single
+    vectorized pass when every value (and the limit) is a plain int or float
+    that float64 represents exactly. Every other mode, and any input with None,
+    bool, str, Decimal or very large int values, falls back to build_comparator()
+    so results always match compare_values().
+
+    Args:
+        source_values: Sequence of source values
+        target_values: Sequence of target values, same length as source_values
+        test_config: Test configuration dictionary (see compare_values)
+
+    Returns:
+        List of "PASS" or "FAIL", one per pair
+
+    Raises:
+        ValueError: If the sequences differ in length
+    """
+    source_values = list(source_values)
+    target_values = list(target_values)
+    if len(source_values) != len(target_values):
+        raise ValueError(
+            f"Cannot compare {len(source_values)} source values with {len(target_values)} target values"
+        )
+
+    threshold = (test_config.get("comparisons") or {}).get("threshold") or {}
+    threshold_value = threshold.get("value")
+    threshold_limit = threshold.get("limit")
+    vectorizable = (
+        threshold_value in ("percentage", "absolute")
+        and _is_float_exact(threshold_limit)
+        and not threshold.get("condition")
+        and all(map(_is_float_exact, source_values))
+        and all(map(_is_float_exact, target_values))
+    )
+
+    if not vectorizable:
+        compare = build_comparator(test_config)
+        return [compare(src, tgt) for src, tgt in zip(source_values, target_values)]
+
+    import numpy as np
+
+    s = np.asarray(source_values, dtype=np.float64)
+    t = np.asarray(target_values, dtype=np.float64)
+
+    # Mirror the scalar comparator: equal values pass, otherwise FAIL only when the
+    # difference exceeds the limit (so a NaN difference passes, as it does there)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if threshold_value == "percentage":
+            # A zero target only passes on an exact match
+            nonzero = t != 0
+            exceeded = np.abs((s - t) / np.where(nonzero, t, 1)) * 100 > threshold_limit
+            passed = (s == t) | (nonzero & ~exceeded)
+        else:
+            passed = (s == t) | ~(np.abs(s - t) > threshold_limit)
+
+    return np.where(passed, "PASS", "FAIL").tolist()
+
+
+# Largest magnitude at which every int converts to float64 exactly
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _is_float_exact(value):
+    """Return True if value is a plain int or float that float64 represents exactly."""
+    value_type = type(value)
+    if value_type is float:
+        return True
+    return value_type is int and -_MAX_EXACT_FLOAT_INT <= value <= _MAX_EXACT_FLOAT_INT
+
+
+def build_comparator(test_config):
+    """
+    Build a comparison function for a single test definition.
+
+    The test configuration is read and the comparison mode is selected once,
+    so the returned function does no dictionary lookups or mode dispatch.
+    See compare_values() for the supported modes.
+
+    Args:
+        test_config: Test configuration dictionary (see compare_values)
+
+    Returns:
+        Callable taking (source_value, target_value) and returning "PASS" or "FAIL"
+    """
+    comparisons = test_config.get("comparisons") or {}
+    source_config = test_config.get("source") or {}
+
+    # Check if expected is a condition like "<=2"
+    operator, threshold = _parse_expected_condition(source_config.get("expected"))
+    has_condition = bool(operator) and threshold is not None
+    compare_mismatch, setting = _select_threshold(comparisons.get("threshold"))
+
+    def compare(source_value, target_value):
+        # Source-only test (no target)
+        if target_value is None:
+            if has_condition:
+                return _compare_source_condition(source_value, operator, threshold)
+            # Backward compatibility: if no condition, check if source is truthy
+            return "PASS" if source_value else "FAIL"
+
+        # Source and target comparison
+        if source_value == target_value:
+            return "PASS"
+
+        # Default: if values don't match and no threshold passes, FAIL
+        if compare_mismatch is None:
+            return "FAIL"
+        return compare_mismatch(source_value, target_value, setting)
+
+    return compare
+
+
+def _select_threshold(threshold):
+    """
+    Select the comparison used when source and target values differ.
+
+    Args:
+        threshold: comparisons.threshold configuration, or None
+
+    Returns:
+        Tuple of (compare_function, setting) where compare_function takes
+        (source_value, target_value, setting), or (None, None) when a mismatch
+        always FAILs
+    """
+    if not threshold:
+        return None, None
+
+    condition = threshold.get("condition")
+    threshold_value = threshold.get("value")
+    threshold_limit = threshold.get("limit")
+
+    # Condition-based threshold (e.g., condition: ">")
+    if condition and not threshold_value:
+        return _compare_threshold_condition, condition
+
+    # Percentage-based threshold
+    if threshold_value == "percentage" and threshold_limit is not None:
+        return _compare_percentage, threshold_limit
+
+    # Absolute threshold
+    if threshold_value == "absolute" and threshold_limit is not None:
+        return _compare_absolute, threshold_limit
+
+    return None, None
+
+
+def _compare_source_condition(source_value, operator, threshold):
+    """Evaluate a source-only expected condition such as "<=2"."""
+    if _apply_operator(source_value, operator, threshold):
+        logger.debug(f"Source value {source_value} {operator} {threshold}: PASS")
+        return "PASS"
+    logger.debug(f"Source value {source_value} {operator} {threshold}: FAIL")
+    return "FAIL"
+
+
+def _compare_threshold_condition(source_value, target_value, condition):
+    """When a threshold condition is specified, FAIL if the condition IS TRUE."""
+    if _apply_operator(source_value, condition, target_value):
+        logger.debug(f"Source {source_value} {condition} Target {target_value}: FAIL")
+        return "FAIL"
+    logger.debug(f"Source {source_value} {condition} Target {target_value}: PASS")
+    return "PASS"
+
+
+def _compare_percentage(source_value, target_value, threshold_limit):
+    """PASS if source is within threshold_limit percent of target."""
+    try:
+        if target_value == 0:
+            # Can't calculate percentage when target is 0
+            return "FAIL" if source_value != target_value else "PASS"
+
+        percentage_diff = abs((source_value - target_value) / target_value) * 100
+        if percentage_diff > threshold_limit:
+            logger.debug(f"Percentage diff {percentage_diff}% > limit {threshold_limit}%: FAIL")
+            return "FAIL"
+        logger.debug(f"Percentage diff {percentage_diff}% <= limit {threshold_limit}%: PASS")
+        return "PASS"
+    except (TypeError, ValueError):
+        logger.warning(f"Cannot calculate percentage threshold for {source_value} vs {target_value}")
+        return "FAIL"
+
+
+def _compare_absolute(source_value, target_value, threshold_limit):
+    """PASS if source differs from target by at most threshold_limit."""
+    try:
+        absolute_diff = abs(source_value - target_value)
+        if absolute_diff > threshold_limit:
+            logger.debug(f"Absolute diff {absolute_diff} > limit {threshold_limit}: FAIL")
+            return "FAIL"
+        logger.debug(f"Absolute diff {absolute_diff} <= limit {threshold_limit}: PASS")
+        return "PASS"
+    except (TypeError, ValueError):
+        logger.warning(f"Cannot calculate absolute threshold for {source_value} vs {target_value}")
+        return "FAIL"
@@ -1,27 +1,209 @@
+import hashlib
+import logging
+import marshal
 import yaml
 import os
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
 
+logger = logging.getLogger(__name__)
 
-def load_config(config_path: str) -> dict:
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Matches ${VAR_NAME} and ${VAR_NAME:default}
+_ENV_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Frozen configs keyed on file identity. Each entry also records the values of
+# the environment variables the file references, since those are substituted
+# before parsing and a change must invalidate the entry.
+_CONFIG_CACHE = {}
+
+# Suffix of precompiled configs written by compile_config()
+COMPILED_SUFFIX = ".compiled"
+
+# Bumped whenever the compiled file layout changes
+_COMPILED_FORMAT_VERSION = 1
+
+
+def file_cache_key(path: str) -> tuple:
+    """Return a (path, mtime, size) key identifying the current file contents."""
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def load_yaml_file(path: str):
+    """
+    Parse a YAML file with the fastest available safe loader.
+
+    The file is read as bytes and streamed into the parser, which handles decoding.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        The parsed document (None for an empty file)
+    """
+    with open(path, "rb") as file:
+        return yaml.load(file, Loader=_Loader)
+
+
+def _env_snapshot(var_names: tuple) -> tuple:
+    """Capture the current values of the given environment variables."""
+    return tuple(os.environ.get(name) for name in var_names)
+
+
+def _env_digest(snapshot: tuple) -> str:
+    """Hash an environment snapshot so compiled files can be checked without storing it."""
+    return hashlib.sha256(repr(snapshot).encode("utf-8")).hexdigest()
+
+
+def _freeze(obj):
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def load_config(config_path: str) -> Mapping:
     """
     Loads YAML configuration file with support for environment variable substitution.
 
     Supports ${VAR_NAME} and ${VAR_NAME:default_value} syntax for environment variables.
+
+    The returned config is read-only: mappings are MappingProxyType views and
+    lists are tuples, so item assignment raises TypeError. It is shared between
+    calls and can be passed across threads without copying; callers that need
+    to modify it must build their own copy.
     """
 
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
+    cache_key = file_cache_key(config_path)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        var_names, snapshot, config = cached
+        if _env_snapshot(var_names) == snapshot:
+            return config
+
+    compiled = _load_compiled_config(config_path, cache_key)
+    if compiled is not None:
+        var_names, config = compiled
+    else:
+        var_names, config = _parse_config_file(config_path)
+
+    config = _freeze(config)
+
+    _CONFIG_CACHE[cache_key] = (var_names, _env_snapshot(var_names), config)
+    return config
+
+
+def _parse_config_file(config_path: str) -> tuple:
+    """
+    Read and parse a YAML config file, substituting environment variables.
+
+    Returns:
+        Tuple of (referenced_env_var_names, parsed_config)
+    """
     with open(config_path, "r") as file:
         config_content = file.read()
 
+    var_names = tuple(
+        dict.fromkeys(expr.split(":", 1)[0] for expr in _ENV_RE.findall(config_content))
+    )
+
     # Substitute environment variables
     config_content = _substitute_env_vars(config_content)
 
-    config = yaml.safe_load(config_content)
+    return var_names, yaml.load(config_content, Loader=_Loader)
 
-    return config
+
+def compile_config(config_path: str) -> str:
+    """
+    Precompile a YAML config so later load_config() calls skip YAML parsing.
+
+    The parsed config is written with marshal next to the YAML file, at
+    config_path + COMPILED_SUFFIX, which is the only place load_config() looks
+    for it. load_config() uses it only while the YAML file is unchanged
+    and the environment variables it references have the same values, so it
+    never serves stale data. As environment values are substituted into the
+    stored config, the file is created with owner-only permissions.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        str: Path to the compiled config
+
+    Raises:
+        FileNotFoundError: If the config file does not exist
+        ValueError: If the config contains values marshal cannot store (e.g. dates)
+    """
+    if not os.path.exists(config_path):
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    output_path = config_path + COMPILED_SUFFIX
+    _, mtime_ns, size = file_cache_key(config_path)
+    var_names, config = _parse_config_file(config_path)
+
+    try:
+        payload = marshal.dumps({
+            "version": _COMPILED_FORMAT_VERSION,
+            "source_mtime_ns": mtime_ns,
+            "source_size": size,
+            "env_vars": var_names,
+            "env_digest": _env_digest(_env_snapshot(var_names)),
+            "config": config,
+        })
+    except ValueError as e:
+        raise ValueError(f"Config {config_path} contains values that cannot be compiled: {e}") from e
+
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as file:
+        file.write(payload)
+
+    logger.info("Compiled config written to: %s", output_path)
+    return output_path
+
+
+def _load_compiled_config(config_path: str, cache_key: tuple):
+    """
+    Load the precompiled form of config_path if it is still valid.
+
+    Returns:
+        Tuple of (referenced_env_var_names, parsed_config), or None if there
+        is no compiled file or it no longer matches the YAML file or environment
+    """
+    compiled_path = config_path + COMPILED_SUFFIX
+    try:
+        with open(compiled_path, "rb") as file:
+            compiled = marshal.load(file)
+    except FileNotFoundError:
+        return None
+    except (EOFError, ValueError, TypeError, OSError) as e:
+        logger.warning("Ignoring unreadable compiled config %s: %s", compiled_path, e)
+        return None
+
+    _, mtime_ns, size = cache_key
+    if (
+        not isinstance(compiled, dict)
+        or compiled.get("version") != _COMPILED_FORMAT_VERSION
+        or compiled.get("source_mtime_ns") != mtime_ns
+        or compiled.get("source_size") != size
+    ):
+        logger.debug("Compiled config %s is out of date, parsing YAML", compiled_path)
+        return None
+
+    var_names = compiled["env_vars"]
+    if compiled["env_digest"] != _env_digest(_env_snapshot(var_names)):
+        logger.debug("Environment changed since %s was compiled, parsing YAML", compiled_path)
+        return None
+
+    return var_names, compiled["config"]
 
 
 def _substitute_env_vars(content: str) -> str:
@@ -33,8 +215,16 @@ def _substitute_env_vars(content: str) -> str:
     - ${VAR_NAME:default}: Uses default if VAR_NAME is not set
     """
 
+    if "${" not in content:
+        return content
+
+    # Resolve each distinct placeholder once, however often it appears
+    resolved = {}
+
     def replace_var(match):
         var_expr = match.group(1)
+        if var_expr in resolved:
+            return resolved[var_expr]
 
         # Check if default value is provided
         if ":" in var_expr:
@@ -50,9 +240,8 @@ def _substitute_env_vars(content: str) -> str:
                 f"Environment variable '{var_name}' is not set and no default provided"
             )
 
+        resolved[var_expr] = value
         return value
 
     # Replace ${VAR_NAME} and ${VAR_NAME:default}
-    pattern = r"\$\{([^}]+)\}"
-    return re.sub(pattern, replace_var, content)
-
+    return _ENV_RE.sub(replace_var, content)
@@ -1,3 +1,27 @@
+import functools
+import os
+import sys
+
+# Execution profile, read once per process
+_ENV = os.environ.get("SPRING_PROFILES_ACTIVE", "mylocal")
+_ENV_UPPER = _ENV.upper()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config_details():
+    """
+    Load castlight config details for the execution profile, once per process.
+
+    Returns:
+        Config object, or None when running locally (MYLOCAL profile)
+    """
+    if _ENV_UPPER == "MYLOCAL":
+        return None
+
+    import castlight_common_lib.configfunctions as cfg
+    return cfg.Config('dataqeteam', [_ENV])
+
+
 def get_connector(config: dict):
 
     db_type = config.get("database_type")
@@ -26,3 +50,20 @@ def get_connector(config: dict):
     else:
         raise ValueError(f"Unsupported database type: {db_type}")
 
+
+def close_all():
+    """
+    Close every pooled MySQL connection and BigQuery client.
+
+    Connectors share pooled connections and clients across executors, keyed on
+    their connection settings, so repeat runs skip re-connecting and re-auth.
+    Call this for explicit teardown; it also runs at interpreter exit. Only
+    connector modules that were already imported are touched.
+    """
+    mysql_module = sys.modules.get(f"{__name__}.mysql_connector")
+    if mysql_module is not None:
+        mysql_module.close_pooled_connections()
+
+    bigquery_module = sys.modules.get(f"{__name__}.bigquery_connector")
+    if bigquery_module is not None:
+        bigquery_module.close_pooled_clients()
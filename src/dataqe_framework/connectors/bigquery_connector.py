@@ -1,16 +1,53 @@
 import os
+import atexit
 import logging
-from google.cloud import bigquery
-from google.oauth2 import service_account
+import threading
+import importlib.util
+from . import _load_config_details
 from .base_connector import BaseConnector
-execution_env = os.environ['SPRING_PROFILES_ACTIVE']
-if (execution_env.upper() != "MYLOCAL"):
-    import castlight_common_lib.configfunctions as cfg
-    config_details = cfg.Config('dataqeteam', [os.environ.get('SPRING_PROFILES_ACTIVE')])
-else:
-    config_details = None
+config_details = _load_config_details()
 logger = logging.getLogger(__name__)
 
+# Arrow downloads are used when pyarrow is installed; checked without importing it
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Google Cloud modules are imported on first connect; importing them pulls in
+# gRPC and protobuf, which MySQL-only runs should not pay for
+bigquery = None
+service_account = None
+
+
+def _import_google_modules():
+    """Import the Google Cloud client modules once, on first use."""
+    global bigquery, service_account
+    if bigquery is None:
+        from google.cloud import bigquery as _bigquery
+        bigquery = _bigquery
+    if service_account is None:
+        from google.oauth2 import service_account as _service_account
+        service_account = _service_account
+
+
+# BigQuery clients are thread-safe, so one client per distinct connection
+# setup is shared by every connector in the process to avoid repeated auth.
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def close_pooled_clients():
+    """Close every shared BigQuery client."""
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled BigQuery client: {str(e)}")
+
+
+atexit.register(close_pooled_clients)
+
 
 class BigQueryConnector(BaseConnector):
     """
@@ -102,12 +139,29 @@ class BigQueryConnector(BaseConnector):
             logger.warning(f"Failed to setup KMS encryption: {str(e)}")
 
     def connect(self):
-        """Establish connection to BigQuery."""
+        """Establish connection to BigQuery, reusing a shared client when possible."""
+        has_credentials_file = bool(self.credentials_path and os.path.exists(self.credentials_path))
+        client_key = (
+            self.project_id,
+            self.location,
+            self.credentials_path if has_credentials_file else None,
+            self.use_encryption,
+            self.infra_core,
+            self.kms_key_ring,
+        )
+
+        with _CLIENTS_LOCK:
+            self.client = _CLIENTS.get(client_key)
+        if self.client:
+            logger.debug(f"Reusing BigQuery client for project: {self.project_id}")
+            return
+
         try:
+            _import_google_modules()
             credentials = None
 
             # Try to get credentials from credentials_path
-            if self.credentials_path and os.path.exists(self.credentials_path):
+            if has_credentials_file:
                 logger.info(f"Using service account credentials from: {self.credentials_path}")
                 credentials = service_account.Credentials.from_service_account_file(
                     self.credentials_path
@@ -136,6 +190,9 @@ class BigQueryConnector(BaseConnector):
                 )
                 logger.info(f"BigQuery connection established (non-PHI)")
 
+            with _CLIENTS_LOCK:
+                self.client = _CLIENTS.setdefault(client_key, self.client)
+
         except Exception as e:
             logger.error(f"Failed to connect to BigQuery: {str(e)}")
             raise ConnectionError(f"Failed to connect to BigQuery: {str(e)}")
@@ -144,38 +201,63 @@ class BigQueryConnector(BaseConnector):
         """
         Execute a BigQuery query and return results.
 
+        Results are downloaded as Arrow when pyarrow is installed and converted
+        to dictionaries in bulk, avoiding a Python-level loop per row.
+
         Args:
             query: SQL query string
 
         Returns:
             List of result rows as dictionaries
         """
-        if not self.client:
-            self.connect()
-
         try:
-            #logger.info(f"Executing query: {query[:100]}..." if len(query) > 100 else f"Executing query: {query}")
-            query_job = self.client.query(query)
-            #logger.info(f"Query submitted, job ID: {query_job.job_id}")
-            results = query_job.result(timeout=120)
-            #logger.info(f"Query execution completed")
+            results = self._run_query(query)
+            if _HAS_PYARROW:
+                return results.to_arrow(create_bqstorage_client=True).to_pylist()
 
             # Convert to list of dictionaries
-            rows = []
-            for row in results:
-                rows.append(dict(row))
+            return [dict(row) for row in results]
+        except Exception as e:
+            logger.error(f"Failed to execute BigQuery query: {str(e)}")
+            raise RuntimeError(f"Failed to execute BigQuery query: {str(e)}")
+
+    def execute_query_arrow(self, query: str):
+        """
+        Execute a BigQuery query and return results as an Arrow table.
+
+        Requires pyarrow. Large results are streamed through the BigQuery
+        Storage API when google-cloud-bigquery-storage is installed.
 
-            #logger.info(f"Query executed successfully, returned {len(rows)} rows")
-            return rows
+        Args:
+            query: SQL query string
+
+        Returns:
+            pyarrow.Table with the query results
+        """
+        try:
+            return self._run_query(query).to_arrow(create_bqstorage_client=True)
         except Exception as e:
             logger.error(f"Failed to execute BigQuery query: {str(e)}")
             raise RuntimeError(f"Failed to execute BigQuery query: {str(e)}")
 
+    def _run_query(self, query: str):
+        """Submit a query, connecting first if needed, and wait for its row iterator."""
+        if not self.client:
+            self.connect()
+
+        #logger.info("Executing query: %.100s%s", query, "..." if len(query) > 100 else "")
+        query_job = self.client.query(query)
+        #logger.info(f"Query submitted, job ID: {query_job.job_id}")
+        return query_job.result(timeout=120)
+
     def close(self):
-        """Close the BigQuery client connection."""
-        if self.client:
-            self.client.close()
-            logger.info("BigQuery connection closed")
+        """
+        Release the BigQuery client.
+
+        The client is shared with other connectors and stays open for reuse;
+        close_pooled_clients() closes it at interpreter exit.
+        """
+        self.client = None
 
     def get_temp_credentials_file(self):
         """
@@ -1,18 +1,56 @@
-import os
-import pymysql
+import atexit
+import threading
 import logging
+from . import _load_config_details
 from .base_connector import BaseConnector
-execution_env = os.environ['SPRING_PROFILES_ACTIVE']
-if (execution_env.upper() != "MYLOCAL"):
-    import castlight_common_lib.configfunctions as cfg
-    config_details = cfg.Config('dataqeteam', [os.environ.get('SPRING_PROFILES_ACTIVE')])
-else:
-    config_details = None
+config_details = _load_config_details()
 logger = logging.getLogger(__name__)
 
+# Imported on first connect so BigQuery-only runs skip loading pymysql
+pymysql = None
+
+# Idle connections keyed on connection parameters. A connector checks one out
+# in connect() and returns it in close(), so connections are reused across
+# connectors and executor runs but never shared by two connectors at once.
+_IDLE_CONNECTIONS = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _checkout_connection(key):
+    """Return a live idle connection for key, or None if none is available."""
+    while True:
+        with _POOL_LOCK:
+            idle = _IDLE_CONNECTIONS.get(key)
+            if not idle:
+                return None
+            connection = idle.pop()
+        try:
+            connection.ping(reconnect=True)
+            return connection
+        except Exception as e:
+            logger.debug(f"Discarding stale pooled MySQL connection: {str(e)}")
+
+
+def close_pooled_connections():
+    """Close every idle pooled MySQL connection."""
+    with _POOL_LOCK:
+        connections = [conn for idle in _IDLE_CONNECTIONS.values() for conn in idle]
+        _IDLE_CONNECTIONS.clear()
+    for connection in connections:
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled MySQL connection: {str(e)}")
+
+
+atexit.register(close_pooled_connections)
+
 
 class MySQLConnector(BaseConnector):
 
+    # Rows fetched per round-trip when streaming results
+    STREAM_BATCH_SIZE = 10_000
+
     def __init__(self, host=None, port=None, user=None, password=None, database=None, k8_db_details=None):
         self.host = host
         self.port = port
@@ -34,9 +72,23 @@ class MySQLConnector(BaseConnector):
                 logger.error(f"Failed to extract Kubernetes configuration: {str(e)}")
                 raise ValueError(f"Invalid k8_db_details format or missing configuration: {str(e)}")
 
+    def _pool_key(self):
+        return (self.host, self.port, self.user, self.password, self.database)
+
     def connect(self):
+        self.connection = _checkout_connection(self._pool_key())
+        if self.connection:
+            logger.debug(f"Reusing pooled MySQL connection to {self.host}:{self.port}/{self.database}")
+            return
+
         logger.info(f"Establishing MySQL connection to {self.host}:{self.port}/{self.database}")
         try:
+            global pymysql
+            if pymysql is None:
+                import pymysql as _pymysql
+                import pymysql.cursors
+                pymysql = _pymysql
+
             self.connection = pymysql.connect(
                 host=self.host,
                 port=self.port,
@@ -50,12 +102,35 @@ class MySQLConnector(BaseConnector):
             logger.error(f"Failed to connect to MySQL: {str(e)}")
             raise
 
-    def execute_query(self, query: str):
+    def execute_query(self, query: str, *, stream: bool = False):
+        """
+        Execute a MySQL query.
+
+        Args:
+            query: SQL query string
+            stream: If True, read rows with a server-side cursor in batches of
+                STREAM_BATCH_SIZE and return an iterator instead of a list, so
+                large results are never fully buffered in client memory. The
+                connection cannot run other queries until the iterator is exhausted.
+
+        Returns:
+            List of result rows as dictionaries, or an iterator of them when streaming
+        """
         if not self.connection:
             self.connect()
 
         try:
-            logger.debug(f"Executing query: {query[:100]}..." if len(query) > 100 else f"Executing query: {query}")
+            # Lazy %-formatting: the message is only built if DEBUG is enabled
+            logger.debug("Executing query: %.100s%s", query, "..." if len(query) > 100 else "")
+            if stream:
+                cursor = self.connection.cursor(pymysql.cursors.SSDictCursor)
+                try:
+                    cursor.execute(query)
+                except Exception:
+                    cursor.close()
+                    raise
+                return self._iter_rows(cursor)
+
             with self.connection.cursor() as cursor:
                 cursor.execute(query)
                 result = cursor.fetchall()
@@ -65,10 +140,36 @@ class MySQLConnector(BaseConnector):
             logger.error(f"Failed to execute MySQL query: {str(e)}")
             raise
 
+    def _iter_rows(self, cursor):
+        """Yield rows from a server-side cursor in batches, closing it when done."""
+        try:
+            while True:
+                rows = cursor.fetchmany(self.STREAM_BATCH_SIZE)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
     def close(self):
+        """Release the connection back to the pool for reuse by later connectors."""
         if self.connection:
-            logger.info("Closing MySQL connection")
-            self.connection.close()
+            logger.debug("Releasing MySQL connection to pool")
+            if self.connection.open:
+                try:
+                    # End the read transaction so the next user sees fresh data
+                    self.connection.rollback()
+                except Exception as e:
+                    # A connection that cannot roll back is broken; close it instead of pooling it
+                    logger.debug(f"Discarding MySQL connection after failed rollback: {str(e)}")
+                    try:
+                        self.connection.close()
+                    except Exception:
+                        pass
+                else:
+                    with _POOL_LOCK:
+                        _IDLE_CONNECTIONS.setdefault(self._pool_key(), []).append(self.connection)
+            self.connection = None
 
     def get_temp_credentials_file(self):
         """
@@ -7,11 +7,73 @@ Supports both local development and Kubernetes environment configurations.
 
 import os
 import json
+import functools
 import logging
+import weakref
+from collections.abc import Mapping
 from typing import Dict, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# Credentials index per config object. Weak keys let an index go away with its
+# config object instead of keeping every config (and its credentials) alive.
+_CREDS_INDEX = weakref.WeakKeyDictionary()
+
+
+def _as_mapping(value: Any) -> Mapping:
+    """Return value if it is a mapping, otherwise an empty dict."""
+    return value if isinstance(value, Mapping) else {}
+
+
+class _NormalizedCreds:
+    """
+    Flat lookup tables built once from a config_details object.
+
+    The nested mysql, bigquery and gcp sections are indexed by database name,
+    (project, dataset) and service account name. Extracted results are
+    memoized in ``extracted``. Lookups that miss the index fall back to
+    walking config_details so the original error messages are preserved.
+    """
+
+    def __init__(self, config_details: Any):
+        data = _as_mapping(getattr(config_details, "data", None))
+        self.mysql = dict(_as_mapping(data.get("mysql")))
+        self.bigquery = {
+            (project_name, dataset_name): dataset_config
+            for project_name, project_config in _as_mapping(data.get("bigquery")).items()
+            for dataset_name, dataset_config in _as_mapping(
+                _as_mapping(project_config).get("datasets")
+            ).items()
+        }
+        self.gcp = dict(_as_mapping(data.get("gcp")))
+        self.extracted = {}
+
+
+def _creds_index(config_details: Any) -> _NormalizedCreds:
+    """
+    Return the credentials index for config_details, building it on first use.
+
+    Objects that cannot be weakly referenced or hashed (e.g. plain dicts) get a
+    fresh, uncached index on every call.
+    """
+    try:
+        index = _CREDS_INDEX.get(config_details)
+    except TypeError:
+        return _NormalizedCreds(config_details)
+    if index is None:
+        index = _CREDS_INDEX[config_details] = _NormalizedCreds(config_details)
+    return index
+
+
+@functools.lru_cache(maxsize=1)
+def _read_profile() -> str:
+    """Read and normalise the execution profile once per process."""
+    profile = os.environ.get(CredentialsExtractor.PROFILE_ENV_VAR,
+                             CredentialsExtractor.DEFAULT_LOCAL_PROFILE).lower()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Execution profile: {profile}")
+    return profile
+
 
 class CredentialsExtractor:
     """
@@ -37,13 +99,23 @@ class CredentialsExtractor:
         """
         Get the execution profile from environment variable.
 
+        The environment is read once and cached; call reset_profile_cache()
+        after changing SPRING_PROFILES_ACTIVE at runtime.
+
         Returns:
             Profile name (MYLOCAL, gcpqa, gcppreprod, or gcpprod)
         """
-        profile = os.environ.get(CredentialsExtractor.PROFILE_ENV_VAR,
-                                CredentialsExtractor.DEFAULT_LOCAL_PROFILE).lower()
-        logger.info(f"Execution profile: {profile}")
-        return profile
+        return _read_profile()
+
+    @staticmethod
+    def reset_profile_cache() -> None:
+        """Forget the cached profile so the next get_profile() re-reads the environment."""
+        _read_profile.cache_clear()
+
+    @staticmethod
+    def clear_caches() -> None:
+        """Drop cached credential extractions, e.g. after the config object is reloaded."""
+        _CREDS_INDEX.clear()
 
     @staticmethod
     def extract_mysql_config(config_details: Dict, database_name: str) -> Dict[str, Any]:
@@ -58,12 +130,23 @@ class CredentialsExtractor:
         Returns:
             Dictionary with keys: host, port, user, password, database
 
+            Results are cached per (config_details, database_name); the config
+            object is treated as immutable for the lifetime of a run.
+
         Raises:
             KeyError: If required MySQL configuration is missing
             ValueError: If database configuration is invalid
         """
+        index = _creds_index(config_details)
+        cache_key = ("mysql", database_name)
+        cached = index.extracted.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            mysql_config = config_details.data['mysql'].get(database_name)
+            mysql_config = index.mysql.get(database_name)
+            if mysql_config is None:
+                mysql_config = config_details.data['mysql'].get(database_name)
 
             if not mysql_config:
                 raise KeyError(f"MySQL configuration not found for database: {database_name}")
@@ -78,13 +161,16 @@ class CredentialsExtractor:
             }
 
             # Validate required fields
-            required_fields = ["host", "user", "password"]
-            for field in required_fields:
-                if not credentials[field]:
-                    raise ValueError(f"Missing required MySQL field: {field}")
+            if not credentials["host"]:
+                raise ValueError("Missing required MySQL field: host")
+            if not credentials["user"]:
+                raise ValueError("Missing required MySQL field: user")
+            if not credentials["password"]:
+                raise ValueError("Missing required MySQL field: password")
 
             logger.info(f"MySQL config extracted for database: {database_name}")
-            return credentials
+            index.extracted[cache_key] = credentials
+            return dict(credentials)
 
         except Exception as e:
             logger.error(f"Failed to extract MySQL configuration: {str(e)}")
@@ -108,29 +194,38 @@ class CredentialsExtractor:
         Returns:
             Dictionary with keys: project_id, dataset_id, location
 
+            Results are cached per (config_details, project_name, dataset_name).
+
         Raises:
             KeyError: If required BigQuery configuration is missing
             ValueError: If specified project/dataset doesn't exist
         """
-        try:
-            # Navigate to dataset configuration
-            bigquery_config = config_details.data.get('bigquery', {})
-
-            if project_name not in bigquery_config:
-                raise ValueError(
-                    f"Project '{project_name}' not found. Available: {list(bigquery_config.keys())}"
-                )
+        index = _creds_index(config_details)
+        cache_key = ("bigquery", project_name, dataset_name)
+        cached = index.extracted.get(cache_key)
+        if cached is not None:
+            return dict(cached)
 
-            project_config = bigquery_config[project_name]
-            datasets = project_config.get('datasets', {})
-
-            if dataset_name not in datasets:
-                raise ValueError(
-                    f"Dataset '{dataset_name}' not found in project '{project_name}'. "
-                    f"Available: {list(datasets.keys())}"
-                )
-
-            dataset_config = datasets[dataset_name]
+        try:
+            dataset_config = index.bigquery.get((project_name, dataset_name))
+
+            if dataset_config is None:
+                # Navigate to dataset configuration
+                bigquery_config = config_details.data.get('bigquery', {})
+
+                project_config = bigquery_config.get(project_name)
+                if project_config is None:
+                    raise ValueError(
+                        f"Project '{project_name}' not found. Available: {list(bigquery_config)}"
+                    )
+
+                datasets = project_config.get('datasets', {})
+                dataset_config = datasets.get(dataset_name)
+                if dataset_config is None:
+                    raise ValueError(
+                        f"Dataset '{dataset_name}' not found in project '{project_name}'. "
+                        f"Available: {list(datasets)}"
+                    )
 
             # Extract BigQuery details
             credentials = {
@@ -144,7 +239,8 @@ class CredentialsExtractor:
                 raise ValueError(f"Missing project_id for dataset '{dataset_name}'")
 
             logger.info(f"BigQuery config extracted for project: {project_name}, dataset: {dataset_name}")
-            return credentials
+            index.extracted[cache_key] = credentials
+            return dict(credentials)
 
         except Exception as e:
             logger.error(f"Failed to extract BigQuery configuration: {str(e)}")
@@ -166,20 +262,30 @@ class CredentialsExtractor:
         Returns:
             Service account JSON string or dict
 
+            Results are cached per (config_details, service_account_name).
+
         Raises:
             KeyError: If service account not found
         """
-        try:
-            gcp_config = config_details.data.get('gcp', {})
+        index = _creds_index(config_details)
+        cache_key = ("gcp", service_account_name)
+        cached = index.extracted.get(cache_key)
+        if cached is not None:
+            return cached
 
-            if service_account_name not in gcp_config:
-                raise KeyError(
-                    f"Service account '{service_account_name}' not found. "
-                    f"Available: {list(gcp_config.keys())}"
-                )
+        try:
+            sa_key = index.gcp.get(service_account_name)
+            if sa_key is None:
+                gcp_config = config_details.data.get('gcp', {})
+                sa_key = gcp_config.get(service_account_name)
+                if sa_key is None:
+                    raise KeyError(
+                        f"Service account '{service_account_name}' not found. "
+                        f"Available: {list(gcp_config)}"
+                    )
 
-            sa_key = gcp_config[service_account_name]
             logger.info(f"Service account credentials extracted: {service_account_name}")
+            index.extracted[cache_key] = sa_key
             return sa_key
 
         except Exception as e:
@@ -208,17 +314,20 @@ class CredentialsExtractor:
             # Ensure output directory exists
             os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
+            # Create the file owner-only (600) so the key is never readable by others
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # The mode above only applies to new files; tighten pre-existing ones too
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o600)
+
             # Write credentials to file
-            with open(output_path, "w") as f:
+            with os.fdopen(fd, "w") as f:
                 if isinstance(sa_key, dict):
-                    json.dump(sa_key, f, indent=2)
+                    json.dump(sa_key, f, separators=(",", ":"))
                 else:
                     # Assume it's already JSON string
                     f.write(sa_key)
 
-            # Restrict file permissions to owner only (600)
-            os.chmod(output_path, 0o600)
-
             logger.info(f"Service account credentials saved to: {output_path}")
             return output_path
 
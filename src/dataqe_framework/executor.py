@@ -1,18 +1,18 @@
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import os
+import time
 import logging
-from dataqe_framework.connectors import get_connector
-from dataqe_framework.comparison.comparator import compare_values
-from dataqe_framework.preprocessor import QueryPreprocessor
+from dataqe_framework.connectors import get_connector, _load_config_details
+from dataqe_framework.comparison.comparator import build_comparator
+from dataqe_framework.preprocessor import QueryPreprocessor, _has_release_placeholders
 
 logger = logging.getLogger(__name__)
 
-# Try to import config_details from castlight_common_lib
+# Share the connectors' castlight config_details, resolved once per process
 try:
-    import castlight_common_lib.configfunctions as cfg
-    _config_details = None
-    if 'SPRING_PROFILES_ACTIVE' in os.environ:
-        _config_details = cfg.Config('dataqeteam', [os.environ.get('SPRING_PROFILES_ACTIVE')])
+    _config_details = _load_config_details()
 except ImportError:
     _config_details = None
 
@@ -32,16 +32,24 @@ def _should_skip_test(test_config: dict) -> bool:
 
 class ValidationExecutor:
 
-    def __init__(self, source_config, target_config, test_cases, preprocessor_queries_path: str = None):
+    def __init__(self, source_config, target_config, test_cases, preprocessor_queries_path: str = None,
+                 parallel_io: bool = True):
         self.source_config = source_config
         self.target_config = target_config
         self.test_cases = test_cases
+        # Each test case is a single-key {name: config} dict; flatten once for the run loop
+        self._tests = [next(iter(test.items())) for test in test_cases]
+        # Comparator per entry of self._tests, built on first comparison and reused across runs
+        self._comparators = [None] * len(self._tests)
         self.preprocessor_queries_path = preprocessor_queries_path
+        # Overlap source and target queries; disable for connectors that aren't thread-safe
+        self.parallel_io = parallel_io
 
         self.source_connector = None
         self.target_connector = None
         self.source_preprocessor = None
         self.target_preprocessor = None
+        self._query_cache = {}  # Processed (query, replacements) per (preprocessor, raw query)
 
         # Extract preprocessor config from source and target
         src_config = self._extract_preprocessor_config(source_config)
@@ -78,7 +86,7 @@ class ValidationExecutor:
 
         # Extract database-specific config (gcp, mysql, etc.)
         db_config = config.get(config_key)
-        if not db_config or not isinstance(db_config, dict):
+        if not db_config or not isinstance(db_config, Mapping):
             return {}
 
         preprocessor_config = {}
@@ -91,8 +99,8 @@ class ValidationExecutor:
         # Extract replace_dataset if present (supports both list and dict formats)
         replace_dataset = db_config.get("replace_dataset")
         if replace_dataset:
-            # Accept list of dicts or dict format
-            if isinstance(replace_dataset, (list, dict)):
+            # Accept list of dicts or dict format (tuples/mappings when loaded frozen)
+            if isinstance(replace_dataset, (list, tuple, Mapping)):
                 preprocessor_config["replace_dataset"] = replace_dataset
 
         return preprocessor_config
@@ -104,6 +112,40 @@ class ValidationExecutor:
         if self.target_config:
             self.target_connector = get_connector(self.target_config)
 
+    def _preflight_mappings(self):
+        """
+        Fetch preprocessor dataset mappings once before any test runs.
+
+        Each side (source/target) with a config_query_key runs its preprocessor
+        query here, so tests only read the cached mappings. Sides where no
+        runnable test query contains release label placeholders are skipped,
+        since their mappings would never be read. Errors are logged and left
+        for the per-test preprocessing to report.
+        """
+        used_sides = set()
+        for _, test_config in self._tests:
+            if _should_skip_test(test_config):
+                continue
+            for side in ("source", "target"):
+                if side in test_config and _has_release_placeholders(test_config[side]["query"]):
+                    used_sides.add(side)
+
+        for side, preprocessor, connector in [
+            ("source", self.source_preprocessor, self.source_connector),
+            ("target", self.target_preprocessor, self.target_connector),
+        ]:
+            if side not in used_sides or not preprocessor or not connector:
+                continue
+
+            config_query_key = preprocessor.preprocessor_config.get("config_query_key")
+            if not config_query_key:
+                continue
+
+            try:
+                preprocessor.get_dataset_mappings(config_query_key, connector)
+            except Exception as e:
+                logger.warning("Preflight of %s dataset mappings failed: %s", side, e)
+
     def run(self, script_name: str = "default"):
         """
         Execute validation tests with timing and detailed result tracking.
@@ -114,19 +156,24 @@ class ValidationExecutor:
         Returns:
             List of test results with execution timing details
         """
-        execution_start = datetime.now()
         self.setup_connectors()
+        self._preflight_mappings()
         results = []
 
+        # A single worker keeps target queries in order on the target connector;
+        # no pool is needed when queries run sequentially
+        query_pool = None
+        if self.parallel_io:
+            query_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dataqe-target")
+
         try:
-            for test in self.test_cases:
+            for test_index, (test_name, test_config) in enumerate(self._tests):
                 test_start = datetime.now()
-                test_name = list(test.keys())[0]
-                test_config = test[test_name]
+                test_start_ns = time.perf_counter_ns()
 
                 # Skip tests marked as invalid
                 if _should_skip_test(test_config):
-                    logger.info(f"Skipping test '{test_name}' (marked as invalid)")
+                    logger.info("Skipping test '%s' (marked as invalid)", test_name)
                     continue
 
                 source_value = None
@@ -139,63 +186,80 @@ class ValidationExecutor:
                 source_replacements = {}
                 target_replacements = {}
 
-                # Run Source
-                if "source" in test_config:
-                    source_query = test_config["source"]["query"]
+                has_source = "source" in test_config
+                has_target = "target" in test_config
 
+                if has_source:
                     # Process query with source preprocessor (automatic replacement of all release labels)
                     source_query, source_replacements = self._process_query_with_preprocessor(
-                        source_query, self.source_connector, self.source_preprocessor
+                        test_config["source"]["query"], self.source_connector, self.source_preprocessor
                     )
 
-                    try:
-                        source_query_start = datetime.now()
-                        source_result = self.source_connector.execute_query(source_query)
-                        source_query_time_ms = self._calculate_duration_ms(source_query_start)
-                        source_value = self._extract_value(source_result)
-                    except Exception as e:
-                        source_query_time_ms = self._calculate_duration_ms(source_query_start)
-                        error_occurred = True
-                        error_type = type(e).__name__
-                        error_message = str(e)
-                        logger.error(f"Error executing source query for test '{test_name}': {error_type} - {error_message}")
-
-                # Run Target (only if source succeeded or no source)
-                if "target" in test_config and not error_occurred:
-                    target_query = test_config["target"]["query"]
-
+                if has_target:
                     # Process query with target preprocessor (automatic replacement of all release labels)
                     target_query, target_replacements = self._process_query_with_preprocessor(
-                        target_query, self.target_connector, self.target_preprocessor
+                        test_config["target"]["query"], self.target_connector, self.target_preprocessor
                     )
 
-                    try:
-                        target_query_start = datetime.now()
-                        target_result = self.target_connector.execute_query(target_query)
-                        target_query_time_ms = self._calculate_duration_ms(target_query_start)
-                        target_value = self._extract_value(target_result)
-                    except Exception as e:
-                        target_query_time_ms = self._calculate_duration_ms(target_query_start)
+                # Source and target run on separate connectors, so the target
+                # query is issued in the background while the source runs
+                target_future = None
+                if (query_pool and has_source and has_target
+                        and self.target_connector is not self.source_connector):
+                    target_future = query_pool.submit(
+                        self._run_timed_query, self.target_connector, target_query
+                    )
+
+                # Run Source
+                if has_source:
+                    source_value, source_query_time_ms, source_error = self._run_timed_query(
+                        self.source_connector, source_query
+                    )
+                    if source_error:
                         error_occurred = True
-                        error_type = type(e).__name__
-                        error_message = str(e)
-                        logger.error(f"Error executing target query for test '{test_name}': {error_type} - {error_message}")
+                        error_type = type(source_error).__name__
+                        error_message = str(source_error)
+                        logger.error("Error executing source query for test '%s': %s - %s", test_name, error_type, error_message)
+
+                # Wait for a target query already in flight even when the source failed,
+                # so the target connector is idle before the next test touches it
+                if target_future and error_occurred:
+                    _, _, target_error = target_future.result()
+                    if target_error:
+                        logger.warning(
+                            "Target query for test '%s' also failed after the source error: %s - %s",
+                            test_name, type(target_error).__name__, target_error
+                        )
+
+                # Run Target (only if source succeeded or no source)
+                if has_target and not error_occurred:
+                    if target_future:
+                        target_value, target_query_time_ms, target_error = target_future.result()
+                    else:
+                        target_value, target_query_time_ms, target_error = self._run_timed_query(
+                            self.target_connector, target_query
+                        )
+                    if target_error:
+                        target_value = None
+                        error_occurred = True
+                        error_type = type(target_error).__name__
+                        error_message = str(target_error)
+                        logger.error("Error executing target query for test '%s': %s - %s", test_name, error_type, error_message)
 
                 # Compare (skip if error occurred)
                 status = "ERROR" if error_occurred else None
                 comparison_time_ms = 0.0
 
                 if not error_occurred:
-                    comparison_start = datetime.now()
-                    status = compare_values(
-                        source_value,
-                        target_value,
-                        test_config
-                    )
-                    comparison_time_ms = self._calculate_duration_ms(comparison_start)
-
+                    comparison_start_ns = time.perf_counter_ns()
+                    compare = self._comparators[test_index]
+                    if compare is None:
+                        compare = self._comparators[test_index] = build_comparator(test_config)
+                    status = compare(source_value, target_value)
+                    comparison_time_ms = self._calculate_duration_ms(comparison_start_ns)
+
+                execution_time_ms = self._calculate_duration_ms(test_start_ns)
                 test_end = datetime.now()
-                execution_time_ms = self._calculate_duration_ms(test_start)
 
                 # Combine source and target replacements
                 all_replacements = self._merge_replacements(source_replacements, target_replacements)
@@ -223,20 +287,42 @@ class ValidationExecutor:
 
             return results
         finally:
+            if query_pool:
+                query_pool.shutdown(wait=True)
             # Cleanup temporary credentials files
             self._cleanup_temp_credentials()
+            self._release_connectors()
+
+    def _calculate_duration_ms(self, start_ns: int) -> float:
+        """Calculate duration in milliseconds from a time.perf_counter_ns() reading to now."""
+        return (time.perf_counter_ns() - start_ns) / 1_000_000
 
-    def _calculate_duration_ms(self, start_time: datetime) -> float:
-        """Calculate duration in milliseconds from start_time to now."""
-        duration = datetime.now() - start_time
-        return duration.total_seconds() * 1000
+    def _run_timed_query(self, connector, query: str) -> tuple:
+        """
+        Execute a query and extract its single value, timing the round-trip.
+
+        Args:
+            connector: Database connector to execute the query on
+            query: Processed query string
+
+        Returns:
+            Tuple of (value, duration_ms, error) where error is the raised
+            exception, or None if the query succeeded
+        """
+        query_start_ns = time.perf_counter_ns()
+        try:
+            result = connector.execute_query(query)
+            duration_ms = self._calculate_duration_ms(query_start_ns)
+            return self._extract_value(result), duration_ms, None
+        except Exception as e:
+            return None, self._calculate_duration_ms(query_start_ns), e
 
     def _extract_value(self, result):
         if not result:
             return None
 
         # assuming single value queries
-        return list(result[0].values())[0]
+        return next(iter(result[0].values()))
 
     def _process_query_with_preprocessor(self, query: str, connector, preprocessor) -> tuple:
         """
@@ -263,6 +349,11 @@ class ValidationExecutor:
             # Preprocessor not initialized or no connector, return original query with empty replacements
             return query, {"dataset_placeholders": {}, "release_labels": {}}
 
+        cache_key = (id(preprocessor), query)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Step 1: Replace dataset placeholders first (e.g., EDW_PRCD_PROJECT)
             processed_query, dataset_replacements = preprocessor.replace_dataset_placeholders(query)
@@ -271,14 +362,21 @@ class ValidationExecutor:
             processed_query, release_replacements = preprocessor.replace_release_labels(processed_query, connector)
 
             # Combine all replacements
-            all_replacements = {
+            result = processed_query, {
                 "dataset_placeholders": dataset_replacements,
                 "release_labels": release_replacements
             }
 
-            return processed_query, all_replacements
+            # Only cache once release labels were resolved (or are not needed),
+            # so a failed mapping lookup is retried by the next test
+            if (preprocessor.release_labels_cache is not None
+                    or not preprocessor.preprocessor_config.get("config_query_key")
+                    or not _has_release_placeholders(processed_query)):
+                self._query_cache[cache_key] = result
+
+            return result
         except Exception as e:
-            logger.error(f"Error processing query with preprocessor: {str(e)}")
+            logger.error("Error processing query with preprocessor: %s", e)
             # Return original query with empty replacements on error
             return query, {"dataset_placeholders": {}, "release_labels": {}}
 
@@ -316,6 +414,21 @@ class ValidationExecutor:
 
         return merged
 
+    def _release_connectors(self):
+        """
+        Release source and target connectors so pooled connections can be reused.
+
+        Errors are logged but do not stop execution.
+        """
+        for connector in [self.source_connector, self.target_connector]:
+            if not connector:
+                continue
+
+            try:
+                connector.close()
+            except Exception as e:
+                logger.warning("Error releasing connector: %s", e)
+
     def _cleanup_temp_credentials(self):
         """
         Cleanup temporary credentials files created by connectors.
@@ -335,9 +448,9 @@ class ValidationExecutor:
                 if temp_file and os.path.exists(temp_file):
                     try:
                         os.remove(temp_file)
-                        logger.info(f"Cleaned up temporary credentials file: {temp_file}")
+                        logger.info("Cleaned up temporary credentials file: %s", temp_file)
                     except Exception as e:
-                        logger.warning(f"Failed to delete temporary credentials file {temp_file}: {str(e)}")
+                        logger.warning("Failed to delete temporary credentials file %s: %s", temp_file, e)
             except Exception as e:
-                logger.warning(f"Error during credentials cleanup: {str(e)}")
+                logger.warning("Error during credentials cleanup: %s", e)
 
@@ -1,12 +1,31 @@
-import yaml
 import os
+import re
+import functools
 import logging
+from collections.abc import Mapping
 from typing import Dict, Any, Optional, List
 from dataqe_framework.connectors import get_connector
+from dataqe_framework.config_loader import file_cache_key, load_yaml_file
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a preprocessor queries file once per (path, mtime, size).
+
+    The mtime and size only form part of the cache key, so an edited file is
+    re-parsed while old versions age out of the bounded cache.
+    """
+    return load_yaml_file(path) or {}
+
+
+def _has_release_placeholders(query: str) -> bool:
+    """Return True if query may contain SOURCE_CURR_WEEK / SOURCE_PREV_WEEK placeholders."""
+    return "_CURR_WEEK" in query or "_PREV_WEEK" in query
+
+
 class QueryPreprocessor:
     """
     Handles dynamic query preprocessing using config_query_key from configuration.
@@ -35,6 +54,10 @@ class QueryPreprocessor:
         self.release_labels_cache = None
         self.config_details = config_details
         self._replace_dataset_cache = {}  # Cache for resolved placeholders
+        self._mappings_cache = {}  # Cache of dataset mappings per (config_query_key, connector)
+        self._placeholder_patterns = {}  # (compiled SOURCE_CURR_WEEK|SOURCE_PREV_WEEK pattern, SOURCE) per source name
+        self._global_patterns = {}  # (release labels, pattern, values) per id(release labels)
+        self._mapping_labels = {}  # (mappings, release labels) per id(mappings)
 
         if self.preprocessor_queries_path:
             self._load_preprocessor_queries()
@@ -88,8 +111,8 @@ class QueryPreprocessor:
 
         if replacements_made:
             logger.debug(
-                f"Replaced dataset placeholders in query. "
-                f"Replacements: {replacements_made}"
+                "Replaced dataset placeholders in query. Replacements: %s",
+                replacements_made
             )
 
         return modified_query, replacements_made
@@ -114,11 +137,11 @@ class QueryPreprocessor:
         """
         mappings = {}
 
-        if isinstance(replace_dataset, list):
+        if isinstance(replace_dataset, (list, tuple)):
             # New format: list of objects with project_name and dataset_name
             for item in replace_dataset:
-                if not isinstance(item, dict):
-                    logger.warning(f"Invalid replace_dataset item (not a dict): {item}")
+                if not isinstance(item, Mapping):
+                    logger.warning("Invalid replace_dataset item (not a dict): %s", item)
                     continue
 
                 project_name = item.get("project_name")
@@ -127,7 +150,7 @@ class QueryPreprocessor:
 
                 if not project_name or not dataset_name:
                     logger.warning(
-                        f"Invalid replace_dataset item (missing project_name or dataset_name): {item}"
+                        "Invalid replace_dataset item (missing project_name or dataset_name): %s", item
                     )
                     continue
 
@@ -141,29 +164,30 @@ class QueryPreprocessor:
                     # Use bq_project_id as fallback
                     project_id = bq_project_id
                     logger.debug(
-                        f"Resolved placeholder {placeholder} to {project_id} "
-                        f"using bq_project_id fallback"
+                        "Resolved placeholder %s to %s using bq_project_id fallback",
+                        placeholder, project_id
                     )
 
                 if project_id:
                     mappings[placeholder] = project_id
                     if self.config_details:
                         logger.debug(
-                            f"Resolved placeholder {placeholder} to {project_id} "
-                            f"from config_details for {project_name}.{dataset_name}"
+                            "Resolved placeholder %s to %s from config_details for %s.%s",
+                            placeholder, project_id, project_name, dataset_name
                         )
                 else:
                     logger.warning(
-                        f"Failed to resolve placeholder {placeholder}: "
-                        f"no project_id from config_details and bq_project_id not provided"
+                        "Failed to resolve placeholder %s: "
+                        "no project_id from config_details and bq_project_id not provided",
+                        placeholder
                     )
 
-        elif isinstance(replace_dataset, dict):
+        elif isinstance(replace_dataset, Mapping):
             # Legacy format: direct placeholder to project_id mapping
-            mappings = replace_dataset
+            mappings = dict(replace_dataset)
 
         else:
-            logger.warning(f"Invalid replace_dataset format: {type(replace_dataset)}")
+            logger.warning("Invalid replace_dataset format: %s", type(replace_dataset))
 
         return mappings
 
@@ -186,8 +210,8 @@ class QueryPreprocessor:
         # If no config_details, cannot lookup
         if not self.config_details:
             logger.debug(
-                f"Cannot lookup project_id for {project_name}.{dataset_name}: "
-                f"config_details not available"
+                "Cannot lookup project_id for %s.%s: config_details not available",
+                project_name, dataset_name
             )
             return None
 
@@ -198,7 +222,7 @@ class QueryPreprocessor:
             return project_id
         except (KeyError, TypeError, AttributeError) as e:
             logger.warning(
-                f"Failed to lookup project_id for {project_name}.{dataset_name}: {str(e)}"
+                "Failed to lookup project_id for %s.%s: %s", project_name, dataset_name, e
             )
             return None
 
@@ -212,15 +236,16 @@ class QueryPreprocessor:
             )
 
         try:
-            with open(self.preprocessor_queries_path, "r") as file:
-                self.preprocessor_queries = yaml.safe_load(file) or {}
+            self.preprocessor_queries = _load_yaml_cached(
+                *file_cache_key(self.preprocessor_queries_path)
+            )
             logger.info(
-                f"Loaded preprocessor queries from: {self.preprocessor_queries_path}"
+                "Loaded preprocessor queries from: %s", self.preprocessor_queries_path
             )
         except FileNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to load preprocessor queries: {str(e)}")
+            logger.error("Failed to load preprocessor queries: %s", e)
             raise RuntimeError(
                 f"Error loading preprocessor queries from {self.preprocessor_queries_path}:\n"
                 f"{type(e).__name__}: {str(e)}"
@@ -243,6 +268,9 @@ class QueryPreprocessor:
                 "bcbsa": {"current_release": "bcbsa_export1", "previous_release": "bcbsa_export3"},
                 "bcbsa_pf": {"current_release": "bcbsa_pf_export2", "previous_release": "bcbsa_export1"}
             }
+
+            Results are cached per (config_query_key, connector) for the lifetime of
+            this preprocessor, so each preprocessor query runs at most once per connector.
         """
         if not self.preprocessor_queries:
             logger.warning("No preprocessor queries loaded")
@@ -250,13 +278,17 @@ class QueryPreprocessor:
 
         if config_query_key not in self.preprocessor_queries:
             logger.warning(
-                f"Config query key not found in preprocessor queries: {config_query_key}"
+                "Config query key not found in preprocessor queries: %s", config_query_key
             )
             return {}
 
+        cache_key = (config_query_key, id(connector))
+        if cache_key in self._mappings_cache:
+            return self._mappings_cache[cache_key]
+
         try:
             query = self.preprocessor_queries[config_query_key]
-            logger.info(f"Executing preprocessor query for key: {config_query_key}")
+            logger.info("Executing preprocessor query for key: %s", config_query_key)
 
             # Execute the query
             results = connector.execute_query(query)
@@ -275,7 +307,7 @@ class QueryPreprocessor:
                         "previous_release": previous_release,
                     }
 
-            logger.info(f"Generated dataset mappings: {mappings}")
+            logger.info("Generated dataset mappings: %s", mappings)
             # if mappings:
             #     logger.info("=" * 60)
             #     logger.info("PREPROCESSOR QUERY RESULTS:")
@@ -284,14 +316,22 @@ class QueryPreprocessor:
             #         logger.info(f"    Current Release: {mapping.get('current_release')}")
             #         logger.info(f"    Previous Release: {mapping.get('previous_release')}")
             #     logger.info("=" * 60)
+            self._mappings_cache[cache_key] = mappings
             return mappings
 
         except Exception as e:
             logger.error(
-                f"Failed to get dataset mappings for key '{config_query_key}': {str(e)}"
+                "Failed to get dataset mappings for key '%s': %s", config_query_key, e
             )
             raise
 
+    def invalidate_mappings(self) -> None:
+        """Clear cached dataset mappings so the next lookup re-runs the preprocessor query."""
+        self._mappings_cache.clear()
+        self._global_patterns.clear()
+        self._mapping_labels.clear()
+        self.release_labels_cache = None
+
     def replace_placeholders_in_query(
         self, query: str, source_name: str, mappings: Dict[str, Dict[str, str]]
     ) -> str:
@@ -308,7 +348,7 @@ class QueryPreprocessor:
         """
         if not mappings or source_name not in mappings:
             logger.debug(
-                f"No mappings found for source: {source_name}, returning original query"
+                "No mappings found for source: %s, returning original query", source_name
             )
             return query
 
@@ -318,24 +358,28 @@ class QueryPreprocessor:
 
         if not current_release or not previous_release:
             logger.warning(
-                f"Incomplete mapping for source {source_name}: {mapping}"
+                "Incomplete mapping for source %s: %s", source_name, mapping
             )
             return query
 
-        # Build source name variations (uppercase for placeholder matching)
-        source_upper = source_name.upper()
-
-        # Replace placeholders with actual dataset names
-        # Format: SOURCE_CURR_WEEK and SOURCE_PREV_WEEK
-        modified_query = query.replace(
-            f"{source_upper}_CURR_WEEK", current_release
-        ).replace(f"{source_upper}_PREV_WEEK", previous_release)
-
-        if modified_query != query:
+        # Replace placeholders with actual dataset names in a single pass
+        # Format: SOURCE_CURR_WEEK and SOURCE_PREV_WEEK (source uppercased)
+        cached = self._placeholder_patterns.get(source_name)
+        if cached is None:
+            source_upper = source_name.upper()
+            cached = (re.compile(f"{re.escape(source_upper)}_(CURR|PREV)_WEEK"), source_upper)
+            self._placeholder_patterns[source_name] = cached
+        pattern, source_upper = cached
+
+        modified_query, replaced_count = pattern.subn(
+            lambda match: current_release if match.group(1) == "CURR" else previous_release,
+            query
+        )
+
+        if replaced_count:
             logger.debug(
-                f"Replaced placeholders for '{source_name}': "
-                f"{source_upper}_CURR_WEEK → {current_release}, "
-                f"{source_upper}_PREV_WEEK → {previous_release}"
+                "Replaced placeholders for '%s': %s_CURR_WEEK → %s, %s_PREV_WEEK → %s",
+                source_name, source_upper, current_release, source_upper, previous_release
             )
 
         return modified_query
@@ -353,7 +397,8 @@ class QueryPreprocessor:
         Args:
             query: Original query string
             config_query_key: Key to look up preprocessor query (optional)
-            source_name: Source name for placeholder replacement (optional)
+            source_name: Source name for placeholder replacement (optional); when
+                omitted, placeholders of every source in the mappings are replaced
             connector: Database connector for executing preprocessor query
 
         Returns:
@@ -366,10 +411,16 @@ class QueryPreprocessor:
         # Get dataset mappings by executing preprocessor query
         mappings = self.get_dataset_mappings(config_query_key, connector)
 
-        # If no mappings or source_name not provided, return original query
-        if not mappings or not source_name:
+        if not mappings:
             return query
 
+        # Without a source_name, replace every known source's placeholders in one pass
+        if not source_name:
+            modified_query, _ = self._replace_all_release_labels(
+                query, self._release_labels_for(mappings)
+            )
+            return modified_query
+
         # Replace placeholders in query
         return self.replace_placeholders_in_query(query, source_name, mappings)
 
@@ -394,6 +445,10 @@ class QueryPreprocessor:
         if not self.preprocessor_config or not self.preprocessor_config.get("config_query_key"):
             return query, {}
 
+        # Plain queries need no release labels, so skip the mapping lookup entirely
+        if not _has_release_placeholders(query):
+            return query, {}
+
         # Get release labels (cache to avoid multiple queries)
         if self.release_labels_cache is None:
             config_query_key = self.preprocessor_config.get("config_query_key")
@@ -402,60 +457,106 @@ class QueryPreprocessor:
             if not release_labels:
                 return query, {}
 
-            # Convert mappings to list format for easier iteration
-            self.release_labels_cache = [
-                {
-                    "source": source,
-                    "curr_release_label": mapping.get("current_release"),
-                    "prev_release_label": mapping.get("previous_release")
-                }
-                for source, mapping in release_labels.items()
-            ]
+            self.release_labels_cache = self._release_labels_for(release_labels)
 
         # Replace all placeholders in query
         return self._replace_all_release_labels(query, self.release_labels_cache)
 
+    def _release_labels_for(self, mappings: Dict[str, Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Convert dataset mappings to release label list format, cached per mappings object.
+
+        Placeholders are precomputed so queries never rebuild them.
+        """
+        cached = self._mapping_labels.get(id(mappings))
+        if cached is not None and cached[0] is mappings:
+            return cached[1]
+
+        release_labels = [
+            {
+                "source": source,
+                "curr_release_label": mapping.get("current_release"),
+                "prev_release_label": mapping.get("previous_release"),
+                "curr_placeholder": f"{source.upper()}_CURR_WEEK",
+                "prev_placeholder": f"{source.upper()}_PREV_WEEK",
+            }
+            for source, mapping in mappings.items()
+        ]
+        self._mapping_labels[id(mappings)] = (mappings, release_labels)
+        return release_labels
+
+    def _build_global_pattern(self, release_labels: List[Dict[str, str]]) -> tuple:
+        """
+        Build one alternation pattern over every placeholder in release_labels.
+
+        Cached per release label list. Longer placeholders are tried first, and
+        the first source to define a placeholder wins, as with sequential replaces.
+
+        Args:
+            release_labels: List of release label mappings
+
+        Returns:
+            Tuple of (compiled_pattern, {placeholder: value}); the pattern is None
+            when no label is complete
+        """
+        cached = self._global_patterns.get(id(release_labels))
+        if cached is not None and cached[0] is release_labels:
+            return cached[1], cached[2]
+
+        values = {}
+        for label in release_labels:
+            source = label.get("source")
+            curr_label = label.get("curr_release_label")
+            prev_label = label.get("prev_release_label")
+
+            if not source or not curr_label or not prev_label:
+                logger.debug("Skipping incomplete label for source '%s'", source)
+                continue
+
+            values.setdefault(label.get("curr_placeholder") or f"{source.upper()}_CURR_WEEK", curr_label)
+            values.setdefault(label.get("prev_placeholder") or f"{source.upper()}_PREV_WEEK", prev_label)
+
+        pattern = None
+        if values:
+            pattern = re.compile(
+                "|".join(re.escape(placeholder) for placeholder in sorted(values, key=len, reverse=True))
+            )
+
+        self._global_patterns[id(release_labels)] = (release_labels, pattern, values)
+        return pattern, values
+
     def _replace_all_release_labels(self, query: str, release_labels: List[Dict[str, str]]) -> tuple:
         """
         Replace all SOURCE_CURR_WEEK and SOURCE_PREV_WEEK placeholders in query.
 
         Args:
             query: Original query string
-            release_labels: List of release label mappings
+            release_labels: List of release label mappings; entries may carry
+                precomputed "curr_placeholder"/"prev_placeholder" keys
 
         Returns:
             Tuple of (modified_query, replacement_dict) where replacement_dict contains
             {"SOURCE_CURR_WEEK": "actual_value", ...} for all replacements made
         """
-        modified_query = query
         replacements_made = {}
 
         if not release_labels:
             logger.debug("No release labels to replace")
-            return modified_query, replacements_made
-
-        for label in release_labels:
-            source = label.get("source", "").upper()
-            curr_label = label.get("curr_release_label")
-            prev_label = label.get("prev_release_label")
-
-            if not source or not curr_label or not prev_label:
-                logger.debug(f"Skipping incomplete label for source '{source}'")
-                continue
+            return query, replacements_made
 
-            # Check if placeholders exist in query before replacing
-            curr_placeholder = f"{source}_CURR_WEEK"
-            prev_placeholder = f"{source}_PREV_WEEK"
+        pattern, values = self._build_global_pattern(release_labels)
+        if pattern is None:
+            return query, replacements_made
 
-            if curr_placeholder in modified_query:
-                modified_query = modified_query.replace(curr_placeholder, curr_label)
-                replacements_made[curr_placeholder] = curr_label
+        def _replace(match):
+            placeholder = match.group(0)
+            replacements_made[placeholder] = values[placeholder]
+            return values[placeholder]
 
-            if prev_placeholder in modified_query:
-                modified_query = modified_query.replace(prev_placeholder, prev_label)
-                replacements_made[prev_placeholder] = prev_label
+        # Single scan over the query for every source's placeholders
+        modified_query = pattern.sub(_replace, query)
 
         if replacements_made:
-            logger.debug(f"Replaced release label placeholders: {replacements_made}")
+            logger.debug("Replaced release label placeholders: %s", replacements_made)
 
         return modified_query, replacements_made
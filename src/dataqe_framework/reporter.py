@@ -1,12 +1,523 @@
 import logging
 import csv
+import functools
+import io
+import operator
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
 
 
 logger = logging.getLogger(__name__)
 
+# CSS row class per test status; unknown statuses render as "invalid"
+_STATUS_CLASS = {
+    "PASS": "pass",
+    "FAIL": "fail",
+    "INVALID": "invalid",
+    "ERROR": "error",
+    "SKIPPED": "skipped"
+}
+
+# The failed-tests report only styles failures; everything else renders as "error"
+_FAILED_STATUS_CLASS = {"FAIL": "fail"}
+
+# Buffer size for report files so multi-MB reports are flushed in a few large writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Translation table escaping cell text in a single C-level pass (same set as html.escape)
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+# Plain numbers never contain markup, so their text skips the escape pass
+_UNESCAPED_TYPES = frozenset((int, float))
+
+
+def _html_str(value: Any) -> str:
+    """Convert value to HTML-escaped text, rendering None as "None"."""
+    value_type = type(value)
+    if value_type is str:
+        return value.translate(_HTML_ESCAPE)
+    if value is None:
+        return "None"
+    if value_type in _UNESCAPED_TYPES:
+        return str(value)
+    return str(value).translate(_HTML_ESCAPE)
+
+
+# Closing markup after the result rows of the execution and failed-tests reports
+_REPORT_TAIL = """
+        </tbody>
+    </table>
+</body>
+</html>
+"""
+
+# Styles for the full execution report
+_REPORT_CSS = """    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .header {
+            background-color: #2c3e50;
+            color: white;
+            padding: 20px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+        }
+        .metadata-section {
+            background-color: #ecf0f1;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+            border-left: 4px solid #3498db;
+        }
+        .metadata-section summary {
+            cursor: pointer;
+            font-weight: bold;
+            color: #2c3e50;
+            user-select: none;
+        }
+        .metadata-section summary:hover {
+            color: #3498db;
+        }
+        .metadata-content {
+            margin-top: 15px;
+            padding-top: 15px;
+            border-top: 1px solid #bdc3c7;
+        }
+        .metadata-content p {
+            margin: 8px 0;
+            line-height: 1.6;
+        }
+        .metadata-content strong {
+            color: #2c3e50;
+            min-width: 150px;
+            display: inline-block;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 15px;
+            margin-bottom: 20px;
+        }
+        .summary-card {
+            background-color: white;
+            padding: 15px;
+            border-radius: 5px;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+        }
+        .summary-card h3 {
+            margin: 0 0 10px 0;
+            color: #2c3e50;
+        }
+        .summary-card .value {
+            font-size: 24px;
+            font-weight: bold;
+            color: #27ae60;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            background-color: white;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+        }
+        th {
+            background-color: #34495e;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            border-bottom: 2px solid #2c3e50;
+        }
+        td {
+            padding: 12px;
+            border-bottom: 1px solid #ecf0f1;
+        }
+        tr.pass {
+            background-color: #d5f4e6;
+        }
+        tr.fail {
+            background-color: #fadbd8;
+        }
+        tr.invalid {
+            background-color: #f4ecf7;
+        }
+        tr.error {
+            background-color: #fef5e7;
+        }
+        tr.skipped {
+            background-color: #d5d8dc;
+        }
+        tr:hover {
+            background-color: #ecf0f1;
+        }
+    </style>"""
+
+# Styles for the failed-tests report
+_FAILED_REPORT_CSS = """    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .header {
+            background-color: #c0392b;
+            color: white;
+            padding: 20px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+        }
+        .metadata-section {
+            background-color: #ecf0f1;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+            border-left: 4px solid #3498db;
+        }
+        .metadata-section summary {
+            cursor: pointer;
+            font-weight: bold;
+            color: #2c3e50;
+            user-select: none;
+        }
+        .metadata-section summary:hover {
+            color: #3498db;
+        }
+        .metadata-content {
+            margin-top: 15px;
+            padding-top: 15px;
+            border-top: 1px solid #bdc3c7;
+        }
+        .metadata-content p {
+            margin: 8px 0;
+            line-height: 1.6;
+        }
+        .metadata-content strong {
+            color: #2c3e50;
+            min-width: 150px;
+            display: inline-block;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 15px;
+            margin-bottom: 20px;
+        }
+        .summary-card {
+            background-color: white;
+            padding: 15px;
+            border-radius: 5px;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+        }
+        .summary-card h3 {
+            margin: 0 0 10px 0;
+            color: #2c3e50;
+        }
+        .summary-card .value {
+            font-size: 24px;
+            font-weight: bold;
+            color: #c0392b;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            background-color: white;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+        }
+        th {
+            background-color: #c0392b;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            border-bottom: 2px solid #a93226;
+        }
+        td {
+            padding: 12px;
+            border-bottom: 1px solid #ecf0f1;
+        }
+        tr.fail {
+            background-color: #fadbd8;
+        }
+        tr.error {
+            background-color: #fef5e7;
+        }
+        tr:hover {
+            background-color: #f5b7b1;
+        }
+    </style>"""
+
+# Styles for the all-passed report
+_ALL_PASSED_CSS = """    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .header {
+            background-color: #27ae60;
+            color: white;
+            padding: 40px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+            text-align: center;
+        }
+        .header h1 {
+            font-size: 2.5em;
+            margin: 10px 0;
+        }
+        .metadata-section {
+            background-color: #ecf0f1;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 20px;
+            border-left: 4px solid #3498db;
+        }
+        .metadata-section summary {
+            cursor: pointer;
+            font-weight: bold;
+            color: #2c3e50;
+            user-select: none;
+        }
+        .metadata-section summary:hover {
+            color: #3498db;
+        }
+        .metadata-content {
+            margin-top: 15px;
+            padding-top: 15px;
+            border-top: 1px solid #bdc3c7;
+        }
+        .metadata-content p {
+            margin: 8px 0;
+            line-height: 1.6;
+        }
+        .metadata-content strong {
+            color: #2c3e50;
+            min-width: 150px;
+            display: inline-block;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 15px;
+            margin-bottom: 20px;
+        }
+        .summary-card {
+            background-color: white;
+            padding: 15px;
+            border-radius: 5px;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+        }
+        .summary-card h3 {
+            margin: 0 0 10px 0;
+            color: #2c3e50;
+        }
+        .summary-card .value {
+            font-size: 24px;
+            font-weight: bold;
+            color: #27ae60;
+        }
+    </style>"""
+
+
+def _write_result_rows(
+    buf: TextIO,
+    results: List[Dict[str, Any]],
+    summary: 'ExecutionSummary',
+    status_classes: Dict[str, str],
+    default_class: str
+) -> None:
+    """
+    Write one HTML table row per test result into buf.
+
+    Args:
+        buf: Text stream receiving the table body (buffer or open file)
+        results: Test result dictionaries to render
+        summary: ExecutionSummary used to format durations
+        status_classes: Mapping of status to CSS class
+        default_class: CSS class for statuses missing from status_classes
+    """
+    # Bind everything used per row to locals so the loop only does fast lookups
+    write = buf.write
+    escape = _html_str
+    format_duration = summary.format_duration
+    class_for = status_classes.get
+    # Row opening tag and escaped status text, built once per distinct status
+    status_markup = {}
+    for result in results:
+        get = result.get
+        status = result["status"]
+        markup = status_markup.get(status)
+        if markup is None:
+            markup = status_markup[status] = (
+                f'<tr class="{class_for(status, default_class)}"><td>',
+                escape(status)
+            )
+
+        write(markup[0])
+        write(escape(result["test_name"]))
+        write("</td><td>")
+        write(escape(get("severity", "N/A")))
+        write("</td><td>")
+        write(escape(get("source_value")))
+        write("</td><td>")
+        write(escape(get("target_value")))
+        write("</td><td>")
+        write(markup[1])
+
+        # Show the error message if an error occurred
+        if get("error_occurred"):
+            error_type = get("error_type", "Unknown")
+            error_msg = get("error_message", "Unknown")
+            # Truncate long error messages for display
+            if len(error_msg) > 100:
+                error_msg = error_msg[:97] + "..."
+            write(
+                f"<br/><small style='color: #c0392b; font-weight: bold;'>"
+                f"{escape(error_type)}: {escape(error_msg)}</small>"
+            )
+
+        write("</td><td>")
+        write(format_duration(get("execution_time_ms", 0)))
+        write("</td></tr>\n")
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_ms(whole_ms: int) -> str:
+    """
+    Format a whole number of milliseconds, memoized since test durations cluster in a small range.
+
+    Args:
+        whole_ms: Duration floored to whole milliseconds
+
+    Returns:
+        Human-readable duration (e.g., 1m 23s 456ms)
+    """
+    # Most tests finish within a second or a minute, so settle those before the full split
+    if 0 <= whole_ms < 1000:
+        return f"{whole_ms}ms"
+
+    total_seconds, remaining_ms = divmod(whole_ms, 1000)
+    if 0 < total_seconds < 60:
+        return f"{total_seconds}s {remaining_ms}ms"
+
+    minutes, seconds = divmod(total_seconds, 60)
+    if minutes > 0:
+        return f"{minutes}m {seconds}s {remaining_ms}ms"
+    # Only negative durations get here; they keep their original formatting
+    return f"{seconds}s {remaining_ms}ms" if seconds > 0 else f"{remaining_ms}ms"
+
+
+def _ensure_output_dir(output_dir: Path) -> None:
+    """Create output_dir if needed; an existing directory costs a single stat call."""
+    if not os.path.isdir(output_dir):
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+
+def _aggregate_replacements(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    """
+    Aggregate unique replacements from all test results.
+
+    Args:
+        results: List of test result dictionaries
+
+    Returns:
+        Dict with 'dataset_placeholders' and 'release_labels' dicts containing unique replacements
+    """
+    dataset_placeholders = {}
+    release_labels = {}
+
+    for result in results:
+        replacements = result.get("replacements")
+        if not replacements:
+            continue
+        dataset_placeholders.update(replacements.get("dataset_placeholders", {}))
+        release_labels.update(replacements.get("release_labels", {}))
+
+    return {
+        "dataset_placeholders": dataset_placeholders,
+        "release_labels": release_labels
+    }
+
+
+def _replacements_for(results: List[Dict[str, Any]], summary: 'ExecutionSummary') -> Dict[str, Dict[str, str]]:
+    """Return aggregated replacements, reusing the summary's aggregate when results are its own."""
+    if results is summary.results:
+        return summary.aggregated_replacements()
+    return _aggregate_replacements(results)
+
+
+# Every field ExecutionReport.csv reads, in the order _csv_result_row unpacks them;
+# executor results always carry all of them
+_CSV_COLUMNS = operator.itemgetter(
+    "test_name", "severity", "source_value", "target_value", "status", "error_occurred",
+    "error_type", "error_message", "execution_time_ms", "source_query_time_ms",
+    "target_query_time_ms", "comparison_time_ms"
+)
+
+
+def _csv_result_row(result: Dict[str, Any], fmt=format, columns=_CSV_COLUMNS) -> tuple:
+    """
+    Build one ExecutionReport.csv row for a test result.
+
+    Args:
+        result: Test result dictionary
+        fmt: Bound format() builtin, passed as a default so lookups stay local
+        columns: itemgetter extracting every column used by the row in one call
+
+    Returns:
+        Tuple of column values in header order
+    """
+    try:
+        (test_name, severity, source_value, target_value, status, error_occurred,
+         error_type, error_message, execution_ms, source_ms, target_ms, comparison_ms) = columns(result)
+    except KeyError:
+        # Hand-built results may omit optional fields; fill in the per-field defaults
+        return _csv_result_row_with_defaults(result, fmt)
+
+    return (
+        test_name,
+        severity,
+        source_value,
+        target_value,
+        status,
+        # Error details only when an error occurred
+        error_type if error_occurred else "",
+        error_message if error_occurred else "",
+        fmt(execution_ms, ".2f"),
+        fmt(source_ms, ".2f"),
+        fmt(target_ms, ".2f"),
+        fmt(comparison_ms, ".2f")
+    )
+
+
+def _csv_result_row_with_defaults(result: Dict[str, Any], fmt=format) -> tuple:
+    """Build one ExecutionReport.csv row for a result that may be missing optional fields."""
+    get = result.get
+    error_occurred = get("error_occurred")
+    return (
+        result["test_name"],
+        get("severity", "N/A"),
+        get("source_value", ""),
+        get("target_value", ""),
+        result["status"],
+        # Error details only when an error occurred
+        get("error_type", "Unknown") if error_occurred else "",
+        get("error_message", "Unknown") if error_occurred else "",
+        fmt(get("execution_time_ms", 0), ".2f"),
+        fmt(get("source_query_time_ms", 0), ".2f"),
+        fmt(get("target_query_time_ms", 0), ".2f"),
+        fmt(get("comparison_time_ms", 0), ".2f")
+    )
+
 
 class ExecutionMetadata:
     """Stores and formats execution metadata for report identification."""
@@ -46,6 +557,7 @@ class ExecutionMetadata:
         self.suite_owners = list(dict.fromkeys(suite_owners)) if suite_owners else []
 
         self.execution_timestamp = execution_timestamp or datetime.now()
+        self._timestamp_str = None  # (timestamp, formatted) from the last get_timestamp_str call
 
     def get_block_list(self) -> str:
         """Return comma-separated block names."""
@@ -66,8 +578,12 @@ class ExecutionMetadata:
         return ", ".join(self.suite_owners)
 
     def get_timestamp_str(self) -> str:
-        """Return formatted timestamp string (YYYY-MM-DD HH:MM:SS)."""
-        return self.execution_timestamp.strftime('%Y-%m-%d %H:%M:%S')
+        """Return formatted timestamp string (YYYY-MM-DD HH:MM:SS), formatted once per timestamp."""
+        cached = self._timestamp_str
+        if cached is None or cached[0] is not self.execution_timestamp:
+            cached = (self.execution_timestamp, self.execution_timestamp.strftime('%Y-%m-%d %H:%M:%S'))
+            self._timestamp_str = cached
+        return cached[1]
 
 
 class ExecutionSummary:
@@ -84,43 +600,55 @@ class ExecutionSummary:
         self.results = results
         self.metadata = metadata
         self.total_tests = len(results)
-        self.passed = sum(1 for r in results if r["status"] == "PASS")
-        self.failed = sum(1 for r in results if r["status"] == "FAIL")
-        self.invalid = sum(1 for r in results if r["status"] == "INVALID")
-        self.error = sum(1 for r in results if r["status"] == "ERROR")
-        self.skipped = sum(1 for r in results if r["status"] == "SKIPPED")
-        self.critical_failed = sum(
-            1 for r in results
-            if r["status"] == "FAIL" and r.get("severity", "").lower() == "critical"
-        )
-        self.total_execution_time_ms = sum(r.get("execution_time_ms", 0) for r in results)
+
+        # Tally everything in a single pass over the results; Counter plus separate passes
+        # for critical failures and total time measured slower than this one loop
+        status_counts = {}
+        critical_failed = 0
+        total_execution_time_ms = 0
+        for r in results:
+            status = r["status"]
+            status_counts[status] = status_counts.get(status, 0) + 1
+            if status == "FAIL" and (r.get("severity") or "").lower() == "critical":
+                critical_failed += 1
+            total_execution_time_ms += r.get("execution_time_ms", 0)
+
+        self.passed = status_counts.get("PASS", 0)
+        self.failed = status_counts.get("FAIL", 0)
+        self.invalid = status_counts.get("INVALID", 0)
+        self.error = status_counts.get("ERROR", 0)
+        self.skipped = status_counts.get("SKIPPED", 0)
+        self.critical_failed = critical_failed
+        self.total_execution_time_ms = total_execution_time_ms
+        self._aggregated_replacements = None
+
+        # Percentages are read by every reporter, so compute them once
+        if self.total_tests:
+            self._pass_percentage = (self.passed / self.total_tests) * 100
+            self._fail_percentage = (self.failed / self.total_tests) * 100
+        else:
+            self._pass_percentage = 0.0
+            self._fail_percentage = 0.0
+
+    def aggregated_replacements(self) -> Dict[str, Dict[str, str]]:
+        """Return unique replacements across all results, aggregated once and shared by every reporter."""
+        if self._aggregated_replacements is None:
+            self._aggregated_replacements = _aggregate_replacements(self.results)
+        return self._aggregated_replacements
 
     def pass_percentage(self) -> float:
-        """Calculate percentage of passing tests."""
-        if self.total_tests == 0:
-            return 0.0
-        return (self.passed / self.total_tests) * 100
+        """Return percentage of passing tests."""
+        return self._pass_percentage
 
     def fail_percentage(self) -> float:
-        """Calculate percentage of failing tests."""
-        if self.total_tests == 0:
-            return 0.0
-        return (self.failed / self.total_tests) * 100
+        """Return percentage of failing tests."""
+        return self._fail_percentage
 
-    def format_duration(self, milliseconds: float) -> str:
+    @staticmethod
+    def format_duration(milliseconds: float) -> str:
         """Format milliseconds to human-readable format (e.g., 1m 23s 456ms)."""
-        total_seconds = int(milliseconds // 1000)
-        remaining_ms = int(milliseconds % 1000)
-
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-
-        if minutes > 0:
-            return f"{minutes}m {seconds}s {remaining_ms}ms"
-        elif seconds > 0:
-            return f"{seconds}s {remaining_ms}ms"
-        else:
-            return f"{remaining_ms}ms"
+        # Only whole milliseconds are displayed, so flooring first keeps the output identical
+        return _format_whole_ms(int(milliseconds // 1))
 
 
 class ConsoleReporter:
@@ -149,21 +677,23 @@ class ConsoleReporter:
             test_name: Name of the test
             result: Test result dictionary with status and timing
         """
-        status = result["status"]
-        execution_time_ms = result.get("execution_time_ms", 0)
-        summary = ExecutionSummary([result])
-        formatted_time = summary.format_duration(execution_time_ms)
+        error_occurred = result.get("error_occurred")
+        # Skip formatting entirely when the message would be filtered out
+        if not self.logger.isEnabledFor(logging.ERROR if error_occurred else logging.INFO):
+            return
 
-        message = f"Test: {test_name} - Status: {status} (Execution time: {formatted_time})"
+        status = result["status"]
+        formatted_time = ExecutionSummary.format_duration(result.get("execution_time_ms", 0))
 
         # Append detailed error message if present
-        if result.get("error_occurred"):
-            error_type = result.get("error_type", "Unknown")
-            error_msg = result.get("error_message", "Unknown")
-            message += f"\n  └─ ERROR: {error_type} - {error_msg}"
-            self.logger.error(message)
+        if error_occurred:
+            self.logger.error(
+                "Test: %s - Status: %s (Execution time: %s)\n  └─ ERROR: %s - %s",
+                test_name, status, formatted_time,
+                result.get("error_type", "Unknown"), result.get("error_message", "Unknown")
+            )
         else:
-            self.logger.info(message)
+            self.logger.info("Test: %s - Status: %s (Execution time: %s)", test_name, status, formatted_time)
 
     def report_summary(self, summary: ExecutionSummary) -> None:
         """
@@ -172,19 +702,23 @@ class ConsoleReporter:
         Args:
             summary: ExecutionSummary instance with aggregated metrics
         """
-        self.logger.info("=" * 60)
-        self.logger.info("EXECUTION SUMMARY")
-        self.logger.info("=" * 60)
-        self.logger.info(f"Total Test Cases: {summary.total_tests}")
-        self.logger.info(f"Passed: {summary.passed} ({summary.pass_percentage():.1f}%)")
-        self.logger.info(f"Failed: {summary.failed} ({summary.fail_percentage():.1f}%)")
-        self.logger.info(f"Errors: {summary.error}")
-        self.logger.info(f"Invalid: {summary.invalid}")
-        self.logger.info(f"Skipped: {summary.skipped}")
-
-        formatted_time = summary.format_duration(summary.total_execution_time_ms)
-        self.logger.info(f"Total Execution Time: {formatted_time}")
-        self.logger.info("=" * 60)
+        log = self.logger
+        # Skip the percentage and duration calls entirely when INFO is disabled
+        if not log.isEnabledFor(logging.INFO):
+            return
+
+        separator = "=" * 60
+        log.info(separator)
+        log.info("EXECUTION SUMMARY")
+        log.info(separator)
+        log.info("Total Test Cases: %d", summary.total_tests)
+        log.info("Passed: %d (%.1f%%)", summary.passed, summary.pass_percentage())
+        log.info("Failed: %d (%.1f%%)", summary.failed, summary.fail_percentage())
+        log.info("Errors: %d", summary.error)
+        log.info("Invalid: %d", summary.invalid)
+        log.info("Skipped: %d", summary.skipped)
+        log.info("Total Execution Time: %s", summary.format_duration(summary.total_execution_time_ms))
+        log.info(separator)
 
 
 class HTMLReporter:
@@ -198,37 +732,7 @@ class HTMLReporter:
             output_dir: Directory to save HTML reports
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def _aggregate_replacements_from_results(self, results: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
-        """
-        Aggregate unique replacements from all test results.
-
-        Args:
-            results: List of test result dictionaries
-
-        Returns:
-            Dict with 'dataset_placeholders' and 'release_labels' dicts containing unique replacements
-        """
-        aggregated = {
-            "dataset_placeholders": {},
-            "release_labels": {}
-        }
-
-        for result in results:
-            replacements = result.get("replacements", {})
-            if not replacements:
-                continue
-
-            # Aggregate dataset placeholders
-            dataset_placeholders = replacements.get("dataset_placeholders", {})
-            aggregated["dataset_placeholders"].update(dataset_placeholders)
-
-            # Aggregate release labels
-            release_labels = replacements.get("release_labels", {})
-            aggregated["release_labels"].update(release_labels)
-
-        return aggregated
+        _ensure_output_dir(self.output_dir)
 
     def generate_report(self, results: List[Dict[str, Any]], summary: ExecutionSummary, metadata: Optional[ExecutionMetadata] = None) -> str:
         """
@@ -245,50 +749,39 @@ class HTMLReporter:
         filename = "ExecutionReport.html"
         filepath = self.output_dir / filename
 
-        html_content = self._build_html(results, summary, metadata)
-
-        with open(filepath, "w") as f:
-            f.write(html_content)
+        # Stream straight to the file so the full document is never held in memory
+        with open(filepath, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+            self._write_html(f, results, summary, metadata)
 
         return str(filepath)
 
     def _build_html(self, results: List[Dict[str, Any]], summary: ExecutionSummary, metadata: Optional[ExecutionMetadata] = None) -> str:
         """Build HTML content for the report."""
-        rows = []
-        for result in results:
-            status_class = self._get_status_class(result["status"])
-            execution_time = summary.format_duration(result.get("execution_time_ms", 0))
-
-            # Build error message display if error occurred
-            error_display = ""
-            if result.get("error_occurred"):
-                error_type = result.get("error_type", "Unknown")
-                error_msg = result.get("error_message", "Unknown")
-                # Truncate long error messages for display
-                if len(error_msg) > 100:
-                    error_msg = error_msg[:97] + "..."
-                error_display = f"<br/><small style='color: #c0392b; font-weight: bold;'>{error_type}: {error_msg}</small>"
-
-            rows.append(
-                f"""
-                <tr class="{status_class}">
-                    <td>{result['test_name']}</td>
-                    <td>{result.get('severity', 'N/A')}</td>
-                    <td>{self._safe_str(result.get('source_value'))}</td>
-                    <td>{self._safe_str(result.get('target_value'))}</td>
-                    <td>{result['status']}{error_display}</td>
-                    <td>{execution_time}</td>
-                </tr>
-                """
-            )
+        buf = io.StringIO()
+        self._write_html(buf, results, summary, metadata)
+        return buf.getvalue()
 
-        rows_html = "\n".join(rows)
+    def _write_html(
+        self,
+        out: TextIO,
+        results: List[Dict[str, Any]],
+        summary: ExecutionSummary,
+        metadata: Optional[ExecutionMetadata] = None
+    ) -> None:
+        """
+        Write the HTML report to out: header and summary, then one row per result, then the closing tags.
 
+        Args:
+            out: Text stream receiving the document (buffer or open file)
+            results: List of test results
+            summary: ExecutionSummary instance
+            metadata: Optional ExecutionMetadata instance with execution context
+        """
         # Build metadata section with aggregated replacements if available
         metadata_html = ""
         if metadata:
             # Aggregate replacements from all results
-            aggregated_replacements = self._aggregate_replacements_from_results(results)
+            aggregated_replacements = _replacements_for(results, summary)
             replacements_html = ""
 
             dataset_placeholders = aggregated_replacements.get("dataset_placeholders", {})
@@ -323,115 +816,17 @@ class HTMLReporter:
     </details>
 """
 
-        return f"""<!DOCTYPE html>
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        out.write(f"""<!DOCTYPE html>
 <html>
 <head>
-    <title>Test Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }}
-        .header {{
-            background-color: #2c3e50;
-            color: white;
-            padding: 20px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }}
-        .metadata-section {{
-            background-color: #ecf0f1;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-            border-left: 4px solid #3498db;
-        }}
-        .metadata-section summary {{
-            cursor: pointer;
-            font-weight: bold;
-            color: #2c3e50;
-            user-select: none;
-        }}
-        .metadata-section summary:hover {{
-            color: #3498db;
-        }}
-        .metadata-content {{
-            margin-top: 15px;
-            padding-top: 15px;
-            border-top: 1px solid #bdc3c7;
-        }}
-        .metadata-content p {{
-            margin: 8px 0;
-            line-height: 1.6;
-        }}
-        .metadata-content strong {{
-            color: #2c3e50;
-            min-width: 150px;
-            display: inline-block;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 15px;
-            margin-bottom: 20px;
-        }}
-        .summary-card {{
-            background-color: white;
-            padding: 15px;
-            border-radius: 5px;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }}
-        .summary-card h3 {{
-            margin: 0 0 10px 0;
-            color: #2c3e50;
-        }}
-        .summary-card .value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #27ae60;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background-color: white;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }}
-        th {{
-            background-color: #34495e;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            border-bottom: 2px solid #2c3e50;
-        }}
-        td {{
-            padding: 12px;
-            border-bottom: 1px solid #ecf0f1;
-        }}
-        tr.pass {{
-            background-color: #d5f4e6;
-        }}
-        tr.fail {{
-            background-color: #fadbd8;
-        }}
-        tr.invalid {{
-            background-color: #f4ecf7;
-        }}
-        tr.error {{
-            background-color: #fef5e7;
-        }}
-        tr.skipped {{
-            background-color: #d5d8dc;
-        }}
-        tr:hover {{
-            background-color: #ecf0f1;
-        }}
-    </style>
+    <title>Test Report - {generated}</title>
+{_REPORT_CSS}
 </head>
 <body>
     <div class="header">
         <h1>Test Execution Report</h1>
-        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p>Generated: {generated}</p>
     </div>
 
     {metadata_html}
@@ -475,29 +870,17 @@ class HTMLReporter:
             </tr>
         </thead>
         <tbody>
-            {rows_html}
-        </tbody>
-    </table>
-</body>
-</html>
-"""
+            """)
+        _write_result_rows(out, results, summary, _STATUS_CLASS, "invalid")
+        out.write(_REPORT_TAIL)
 
     def _get_status_class(self, status: str) -> str:
         """Get CSS class for status."""
-        status_map = {
-            "PASS": "pass",
-            "FAIL": "fail",
-            "INVALID": "invalid",
-            "ERROR": "error",
-            "SKIPPED": "skipped"
-        }
-        return status_map.get(status, "invalid")
+        return _STATUS_CLASS.get(status, "invalid")
 
     def _safe_str(self, value: Any) -> str:
-        """Safely convert value to string for HTML."""
-        if value is None:
-            return "None"
-        return str(value)
+        """Safely convert value to HTML-escaped string."""
+        return _html_str(value)
 
 
 class CSVReporter:
@@ -511,37 +894,7 @@ class CSVReporter:
             output_dir: Directory to save CSV reports
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def _aggregate_replacements_from_results(self, results: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
-        """
-        Aggregate unique replacements from all test results.
-
-        Args:
-            results: List of test result dictionaries
-
-        Returns:
-            Dict with 'dataset_placeholders' and 'release_labels' dicts containing unique replacements
-        """
-        aggregated = {
-            "dataset_placeholders": {},
-            "release_labels": {}
-        }
-
-        for result in results:
-            replacements = result.get("replacements", {})
-            if not replacements:
-                continue
-
-            # Aggregate dataset placeholders
-            dataset_placeholders = replacements.get("dataset_placeholders", {})
-            aggregated["dataset_placeholders"].update(dataset_placeholders)
-
-            # Aggregate release labels
-            release_labels = replacements.get("release_labels", {})
-            aggregated["release_labels"].update(release_labels)
-
-        return aggregated
+        _ensure_output_dir(self.output_dir)
 
     def generate_report(self, results: List[Dict[str, Any]], summary: ExecutionSummary, metadata: Optional[ExecutionMetadata] = None) -> str:
         """
@@ -558,7 +911,7 @@ class CSVReporter:
         filename = "ExecutionReport.csv"
         filepath = self.output_dir / filename
 
-        with open(filepath, "w", newline="") as f:
+        with open(filepath, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
 
             # Write headers
@@ -576,30 +929,8 @@ class CSVReporter:
                 "Comparison Time (ms)"
             ])
 
-            # Write test results
-            for result in results:
-                # Create status with error details if applicable
-                status_display = result["status"]
-                error_type_display = ""
-                error_msg_display = ""
-
-                if result.get("error_occurred"):
-                    error_type_display = result.get("error_type", "Unknown")
-                    error_msg_display = result.get("error_message", "Unknown")
-
-                writer.writerow([
-                    result["test_name"],
-                    result.get("severity", "N/A"),
-                    result.get("source_value", ""),
-                    result.get("target_value", ""),
-                    status_display,
-                    error_type_display,
-                    error_msg_display,
-                    f"{result.get('execution_time_ms', 0):.2f}",
-                    f"{result.get('source_query_time_ms', 0):.2f}",
-                    f"{result.get('target_query_time_ms', 0):.2f}",
-                    f"{result.get('comparison_time_ms', 0):.2f}"
-                ])
+            # Write test results in one batched call
+            writer.writerows(map(_csv_result_row, results))
 
             # Write summary section
             writer.writerow([])
@@ -623,7 +954,7 @@ class CSVReporter:
                 writer.writerow(["Execution Timestamp", metadata.get_timestamp_str()])
 
                 # Write aggregated replacements if any exist
-                aggregated_replacements = self._aggregate_replacements_from_results(results)
+                aggregated_replacements = _replacements_for(results, summary)
                 dataset_placeholders = aggregated_replacements.get("dataset_placeholders", {})
                 release_labels = aggregated_replacements.get("release_labels", {})
 
@@ -653,7 +984,7 @@ class AutomationDataReporter:
             output_dir: Directory to save AutomationData.csv
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_output_dir(self.output_dir)
 
     def generate_report(
         self,
@@ -685,7 +1016,7 @@ class AutomationDataReporter:
         # Convert milliseconds to seconds for duration
         duration_seconds = int(summary.total_execution_time_ms / 1000)
 
-        with open(filepath, "w", newline="") as f:
+        with open(filepath, "w", encoding="utf-8", newline="") as f:
             writer = csv.writer(f)
 
             # Write header
@@ -734,37 +1065,7 @@ class FailedExecutionReporter:
             output_dir: Directory to save FailedExecutionReport.html
         """
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def _aggregate_replacements_from_results(self, results: List[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
-        """
-        Aggregate unique replacements from all test results.
-
-        Args:
-            results: List of test result dictionaries
-
-        Returns:
-            Dict with 'dataset_placeholders' and 'release_labels' dicts containing unique replacements
-        """
-        aggregated = {
-            "dataset_placeholders": {},
-            "release_labels": {}
-        }
-
-        for result in results:
-            replacements = result.get("replacements", {})
-            if not replacements:
-                continue
-
-            # Aggregate dataset placeholders
-            dataset_placeholders = replacements.get("dataset_placeholders", {})
-            aggregated["dataset_placeholders"].update(dataset_placeholders)
-
-            # Aggregate release labels
-            release_labels = replacements.get("release_labels", {})
-            aggregated["release_labels"].update(release_labels)
-
-        return aggregated
+        _ensure_output_dir(self.output_dir)
 
     def generate_report(self, results: List[Dict[str, Any]], summary: ExecutionSummary, metadata: Optional[ExecutionMetadata] = None) -> str:
         """
@@ -781,58 +1082,52 @@ class FailedExecutionReporter:
         filename = "FailedExecutionReport.html"
         filepath = self.output_dir / filename
 
-        # Filter failed and error tests
-        failed_tests = [r for r in results if r["status"] == "FAIL"]
-        error_tests = [r for r in results if r["status"] == "ERROR"]
-        all_problem_tests = failed_tests + error_tests
-
-        if all_problem_tests:
-            html_content = self._build_failed_tests_html(all_problem_tests, summary, metadata)
-        else:
-            html_content = self._build_all_passed_html(summary, metadata, results)
-
-        with open(filepath, "w") as f:
-            f.write(html_content)
+        # Split failed and error tests in one pass; failures are listed first
+        all_problem_tests = []
+        error_tests = []
+        for r in results:
+            status = r["status"]
+            if status == "FAIL":
+                all_problem_tests.append(r)
+            elif status == "ERROR":
+                error_tests.append(r)
+        all_problem_tests.extend(error_tests)
+
+        with open(filepath, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+            if all_problem_tests:
+                self._write_failed_tests_html(f, all_problem_tests, summary, metadata)
+            else:
+                f.write(self._build_all_passed_html(summary, metadata, results))
 
         return str(filepath)
 
     def _build_failed_tests_html(self, failed_tests: List[Dict[str, Any]], summary: ExecutionSummary, metadata: Optional[ExecutionMetadata] = None) -> str:
         """Build HTML content for failed tests."""
-        rows = []
-        for result in failed_tests:
-            execution_time = summary.format_duration(result.get("execution_time_ms", 0))
-            status_class = "fail" if result["status"] == "FAIL" else "error"
-
-            # Build error message display if error occurred
-            error_display = ""
-            if result.get("error_occurred"):
-                error_type = result.get("error_type", "Unknown")
-                error_msg = result.get("error_message", "Unknown")
-                # Truncate long error messages for display
-                if len(error_msg) > 100:
-                    error_msg = error_msg[:97] + "..."
-                error_display = f"<br/><small style='color: #c0392b; font-weight: bold;'>{error_type}: {error_msg}</small>"
-
-            rows.append(
-                f"""
-                <tr class="{status_class}">
-                    <td>{result['test_name']}</td>
-                    <td>{result.get('severity', 'N/A')}</td>
-                    <td>{self._safe_str(result.get('source_value'))}</td>
-                    <td>{self._safe_str(result.get('target_value'))}</td>
-                    <td>{result['status']}{error_display}</td>
-                    <td>{execution_time}</td>
-                </tr>
-                """
-            )
+        buf = io.StringIO()
+        self._write_failed_tests_html(buf, failed_tests, summary, metadata)
+        return buf.getvalue()
 
-        rows_html = "\n".join(rows)
+    def _write_failed_tests_html(
+        self,
+        out: TextIO,
+        failed_tests: List[Dict[str, Any]],
+        summary: ExecutionSummary,
+        metadata: Optional[ExecutionMetadata] = None
+    ) -> None:
+        """
+        Write the failed-tests report to out, streaming the rows between the header and closing tags.
 
+        Args:
+            out: Text stream receiving the document (buffer or open file)
+            failed_tests: Failed and errored test results to list
+            summary: ExecutionSummary instance
+            metadata: Optional ExecutionMetadata instance with execution context
+        """
         # Build metadata section with aggregated replacements if available
         metadata_html = ""
         if metadata:
             # Aggregate replacements from all results
-            aggregated_replacements = self._aggregate_replacements_from_results(failed_tests)
+            aggregated_replacements = _replacements_for(failed_tests, summary)
             replacements_html = ""
 
             dataset_placeholders = aggregated_replacements.get("dataset_placeholders", {})
@@ -867,106 +1162,17 @@ class FailedExecutionReporter:
     </details>
 """
 
-        return f"""<!DOCTYPE html>
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        out.write(f"""<!DOCTYPE html>
 <html>
 <head>
-    <title>Failed Execution Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }}
-        .header {{
-            background-color: #c0392b;
-            color: white;
-            padding: 20px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }}
-        .metadata-section {{
-            background-color: #ecf0f1;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-            border-left: 4px solid #3498db;
-        }}
-        .metadata-section summary {{
-            cursor: pointer;
-            font-weight: bold;
-            color: #2c3e50;
-            user-select: none;
-        }}
-        .metadata-section summary:hover {{
-            color: #3498db;
-        }}
-        .metadata-content {{
-            margin-top: 15px;
-            padding-top: 15px;
-            border-top: 1px solid #bdc3c7;
-        }}
-        .metadata-content p {{
-            margin: 8px 0;
-            line-height: 1.6;
-        }}
-        .metadata-content strong {{
-            color: #2c3e50;
-            min-width: 150px;
-            display: inline-block;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 15px;
-            margin-bottom: 20px;
-        }}
-        .summary-card {{
-            background-color: white;
-            padding: 15px;
-            border-radius: 5px;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }}
-        .summary-card h3 {{
-            margin: 0 0 10px 0;
-            color: #2c3e50;
-        }}
-        .summary-card .value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #c0392b;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background-color: white;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }}
-        th {{
-            background-color: #c0392b;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            border-bottom: 2px solid #a93226;
-        }}
-        td {{
-            padding: 12px;
-            border-bottom: 1px solid #ecf0f1;
-        }}
-        tr.fail {{
-            background-color: #fadbd8;
-        }}
-        tr.error {{
-            background-color: #fef5e7;
-        }}
-        tr:hover {{
-            background-color: #f5b7b1;
-        }}
-    </style>
+    <title>Failed Execution Report - {generated}</title>
+{_FAILED_REPORT_CSS}
 </head>
 <body>
     <div class="header">
         <h1>⚠️ Failed Test Execution Report</h1>
-        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p>Generated: {generated}</p>
         <p>Total Problem Tests: <strong>{len(failed_tests)}</strong></p>
     </div>
 
@@ -1011,12 +1217,9 @@ class FailedExecutionReporter:
             </tr>
         </thead>
         <tbody>
-            {rows_html}
-        </tbody>
-    </table>
-</body>
-</html>
-"""
+            """)
+        _write_result_rows(out, failed_tests, summary, _FAILED_STATUS_CLASS, "error")
+        out.write(_REPORT_TAIL)
 
     def _build_all_passed_html(self, summary: ExecutionSummary, metadata: Optional[ExecutionMetadata] = None, results: Optional[List[Dict[str, Any]]] = None) -> str:
         """Build HTML content for all-passed message."""
@@ -1026,7 +1229,7 @@ class FailedExecutionReporter:
             # Aggregate replacements from all results if provided
             replacements_html = ""
             if results:
-                aggregated_replacements = self._aggregate_replacements_from_results(results)
+                aggregated_replacements = _replacements_for(results, summary)
                 dataset_placeholders = aggregated_replacements.get("dataset_placeholders", {})
                 release_labels = aggregated_replacements.get("release_labels", {})
 
@@ -1059,85 +1262,17 @@ class FailedExecutionReporter:
     </details>
 """
 
+        generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         return f"""<!DOCTYPE html>
 <html>
 <head>
-    <title>Failed Execution Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }}
-        .header {{
-            background-color: #27ae60;
-            color: white;
-            padding: 40px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-            text-align: center;
-        }}
-        .header h1 {{
-            font-size: 2.5em;
-            margin: 10px 0;
-        }}
-        .metadata-section {{
-            background-color: #ecf0f1;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-            border-left: 4px solid #3498db;
-        }}
-        .metadata-section summary {{
-            cursor: pointer;
-            font-weight: bold;
-            color: #2c3e50;
-            user-select: none;
-        }}
-        .metadata-section summary:hover {{
-            color: #3498db;
-        }}
-        .metadata-content {{
-            margin-top: 15px;
-            padding-top: 15px;
-            border-top: 1px solid #bdc3c7;
-        }}
-        .metadata-content p {{
-            margin: 8px 0;
-            line-height: 1.6;
-        }}
-        .metadata-content strong {{
-            color: #2c3e50;
-            min-width: 150px;
-            display: inline-block;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 15px;
-            margin-bottom: 20px;
-        }}
-        .summary-card {{
-            background-color: white;
-            padding: 15px;
-            border-radius: 5px;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }}
-        .summary-card h3 {{
-            margin: 0 0 10px 0;
-            color: #2c3e50;
-        }}
-        .summary-card .value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #27ae60;
-        }}
-    </style>
+    <title>Failed Execution Report - {generated}</title>
+{_ALL_PASSED_CSS}
 </head>
 <body>
     <div class="header">
         <h1>✅ All Tests Passed!</h1>
-        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        <p>Generated: {generated}</p>
         <p>No failed tests detected in this execution</p>
     </div>
 
@@ -1166,7 +1301,5 @@ class FailedExecutionReporter:
 """
 
     def _safe_str(self, value: Any) -> str:
-        """Safely convert value to string for HTML."""
-        if value is None:
-            return "None"
-        return str(value)
+        """Safely convert value to HTML-escaped string."""
+        return _html_str(value)
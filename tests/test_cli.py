@@ -0,0 +1,144 @@
+"""
+Tests for CLI helper functions.
+"""
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+from dataqe_framework.cli import clean_output_directory, prepare_output_directory, compile_main, execute_block
+
+
+class TestOutputDirectory(unittest.TestCase):
+    """Test cases for output directory preparation and cleanup."""
+
+    def test_clean_removes_files_and_keeps_subdirectories(self):
+        """Test that cleaning removes files but leaves subdirectories intact."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            open(os.path.join(output_dir, "ExecutionReport.html"), "w").close()
+            open(os.path.join(output_dir, ".dataqe_invalid_tests.yml"), "w").close()
+            os.mkdir(os.path.join(output_dir, "archive"))
+            open(os.path.join(output_dir, "archive", "old.html"), "w").close()
+
+            clean_output_directory(output_dir)
+
+            self.assertEqual(os.listdir(output_dir), ["archive"])
+            self.assertEqual(os.listdir(os.path.join(output_dir, "archive")), ["old.html"])
+
+    def test_clean_continues_when_a_file_disappears(self):
+        """Test that a file vanishing mid-cleanup does not stop removal of the others."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            for name in ("a.html", "b.html", "c.html"):
+                open(os.path.join(output_dir, name), "w").close()
+
+            real_unlink = os.unlink
+            calls = []
+
+            def flaky_unlink(path):
+                calls.append(path)
+                if len(calls) == 1:
+                    raise FileNotFoundError(path)
+                real_unlink(path)
+
+            with patch("dataqe_framework.cli.os.unlink", side_effect=flaky_unlink):
+                clean_output_directory(output_dir)
+
+            self.assertEqual(len(calls), 3)
+            self.assertEqual(len(os.listdir(output_dir)), 1)
+
+    def test_clean_missing_directory_is_noop(self):
+        """Test that cleaning a directory that does not exist does nothing."""
+        with tempfile.TemporaryDirectory() as parent:
+            missing = os.path.join(parent, "missing")
+            clean_output_directory(missing)
+            self.assertFalse(os.path.exists(missing))
+
+    def test_prepare_creates_directory(self):
+        """Test that prepare creates the output directory when needed."""
+        with tempfile.TemporaryDirectory() as parent:
+            output_dir = os.path.join(parent, "reports", "run1")
+            prepare_output_directory(output_dir)
+            self.assertTrue(os.path.isdir(output_dir))
+
+
+class TestExecuteBlock(unittest.TestCase):
+    """Test cases for passing block settings to the executor."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.script_path = os.path.join(self.temp_dir.name, "tests.yml")
+        with open(self.script_path, "w") as f:
+            f.write("- T1:\n    source:\n      query: SELECT 1\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _block(self, **other):
+        return {"source": {}, "target": {}, "other": {"validation_script": self.script_path, **other}}
+
+    def _execute(self, block_config):
+        with patch("dataqe_framework.cli.ValidationExecutor") as mock_executor:
+            mock_executor.return_value.run.return_value = []
+            execute_block("block1", block_config, "config.yml", self.temp_dir.name)
+        return mock_executor
+
+    def test_parallel_io_defaults_to_true(self):
+        """Test that parallel I/O is enabled when the block does not set it."""
+        mock_executor = self._execute(self._block())
+        self.assertIs(mock_executor.call_args.kwargs["parallel_io"], True)
+
+    def test_parallel_io_false_is_passed_through(self):
+        """Test that parallel_io: false reaches the executor."""
+        mock_executor = self._execute(self._block(parallel_io=False))
+        self.assertIs(mock_executor.call_args.kwargs["parallel_io"], False)
+
+    def test_non_bool_parallel_io_is_rejected(self):
+        """Test that a non-boolean parallel_io (e.g. a quoted "false") is reported, not treated as truthy."""
+        for value in ("false", "no", 0):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError) as ctx:
+                    self._execute(self._block(parallel_io=value))
+                self.assertIn("parallel_io", str(ctx.exception))
+
+
+class TestCompileMain(unittest.TestCase):
+    """Test cases for the dataqe-compile entry point."""
+
+    def test_compiles_next_to_config(self):
+        """Test that the compiled config is written where dataqe-run looks for it."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.yml")
+            with open(config_path, "w") as f:
+                f.write("block:\n  port: 3306\n")
+
+            with patch("sys.argv", ["dataqe-compile", "--config", config_path]):
+                compile_main()
+
+            self.assertTrue(os.path.exists(config_path + ".compiled"))
+
+    def test_missing_config_exits_with_error(self):
+        """Test that a missing config is logged and exits non-zero."""
+        with patch("sys.argv", ["dataqe-compile", "--config", "/nonexistent/config.yml"]):
+            with self.assertLogs("dataqe_framework.cli", level="ERROR"):
+                with self.assertRaises(SystemExit) as ctx:
+                    compile_main()
+
+        self.assertEqual(ctx.exception.code, 1)
+
+    def test_unsupported_values_exit_with_error(self):
+        """Test that a config marshal cannot store is logged and exits non-zero."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "config.yml")
+            with open(config_path, "w") as f:
+                f.write("block:\n  released: 2024-01-01\n")
+
+            with patch("sys.argv", ["dataqe-compile", "--config", config_path]):
+                with self.assertLogs("dataqe_framework.cli", level="ERROR"):
+                    with self.assertRaises(SystemExit) as ctx:
+                        compile_main()
+
+            self.assertEqual(ctx.exception.code, 1)
+            self.assertFalse(os.path.exists(config_path + ".compiled"))
+
+
+if __name__ == "__main__":
+    unittest.main()
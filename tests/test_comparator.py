@@ -0,0 +1,174 @@
+"""
+Tests for comparison helpers in comparison/comparator.py.
+"""
+import unittest
+from decimal import Decimal
+from dataqe_framework.comparison.comparator import (
+    _parse_condition_text,
+    _parse_expected_condition,
+    build_comparator,
+    compare_values,
+    compare_values_batch,
+)
+
+try:
+    import numpy  # noqa: F401
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class TestParseExpectedCondition(unittest.TestCase):
+    """Test cases for _parse_expected_condition."""
+
+    def test_parses_all_operators(self):
+        """Test that each supported operator is recognised."""
+        self.assertEqual(_parse_expected_condition("<=2"), ("<=", 2.0))
+        self.assertEqual(_parse_expected_condition(">=2"), (">=", 2.0))
+        self.assertEqual(_parse_expected_condition("==10"), ("==", 10.0))
+        self.assertEqual(_parse_expected_condition("!=0"), ("!=", 0.0))
+        self.assertEqual(_parse_expected_condition("<3"), ("<", 3.0))
+        self.assertEqual(_parse_expected_condition(">5"), (">", 5.0))
+
+    def test_allows_whitespace_and_negative_decimals(self):
+        """Test that surrounding whitespace and negative decimals are accepted."""
+        self.assertEqual(_parse_expected_condition("  <=  -2.5  "), ("<=", -2.5))
+
+    def test_rejects_non_conditions(self):
+        """Test that strings that are not simple conditions return (None, None)."""
+        for expected in ["5", "=5", "<=", "> 1e3", ">inf", ">+1", ">=.5", ">=1.", "<=2 rows"]:
+            self.assertEqual(_parse_expected_condition(expected), (None, None), expected)
+
+    def test_rejects_non_strings(self):
+        """Test that non-string input returns (None, None)."""
+        self.assertEqual(_parse_expected_condition(None), (None, None))
+        self.assertEqual(_parse_expected_condition(5), (None, None))
+
+    def test_repeated_conditions_are_cached(self):
+        """Test that parsing the same condition twice hits the cache."""
+        _parse_condition_text.cache_clear()
+        _parse_expected_condition(">=7")
+        _parse_expected_condition(">=7")
+        self.assertEqual(_parse_condition_text.cache_info().hits, 1)
+
+
+class TestBuildComparator(unittest.TestCase):
+    """Test cases for build_comparator and compare_values."""
+
+    def test_source_only_condition(self):
+        """Test source-only tests evaluate the expected condition."""
+        compare = build_comparator({"source": {"query": "SELECT 1", "expected": "<=2"}})
+        self.assertEqual(compare(2, None), "PASS")
+        self.assertEqual(compare(3, None), "FAIL")
+
+    def test_source_only_truthiness_without_condition(self):
+        """Test source-only tests without a condition fall back to truthiness."""
+        compare = build_comparator({"source": {"query": "SELECT 1"}})
+        self.assertEqual(compare(1, None), "PASS")
+        self.assertEqual(compare(0, None), "FAIL")
+
+    def test_equality_without_threshold(self):
+        """Test plain equality when no threshold is configured."""
+        compare = build_comparator({"comparisons": {}})
+        self.assertEqual(compare(10, 10), "PASS")
+        self.assertEqual(compare(10, 11), "FAIL")
+
+    def test_percentage_threshold(self):
+        """Test percentage thresholds, including a zero target."""
+        compare = build_comparator(
+            {"comparisons": {"threshold": {"value": "percentage", "limit": 5}}}
+        )
+        self.assertEqual(compare(104, 100), "PASS")
+        self.assertEqual(compare(106, 100), "FAIL")
+        self.assertEqual(compare(1, 0), "FAIL")
+
+    def test_absolute_threshold(self):
+        """Test absolute thresholds."""
+        compare = build_comparator(
+            {"comparisons": {"threshold": {"value": "absolute", "limit": 2}}}
+        )
+        self.assertEqual(compare(12, 10), "PASS")
+        self.assertEqual(compare(13, 10), "FAIL")
+
+    def test_condition_threshold_fails_when_condition_true(self):
+        """Test that a threshold condition FAILs when the condition holds."""
+        compare = build_comparator({"comparisons": {"threshold": {"condition": ">"}}})
+        self.assertEqual(compare(5, 3), "FAIL")
+        self.assertEqual(compare(3, 5), "PASS")
+
+    def test_compare_values_matches_comparator(self):
+        """Test that compare_values gives the same result as build_comparator."""
+        test_config = {"comparisons": {"threshold": {"value": "absolute", "limit": 1}}}
+        self.assertEqual(compare_values(11, 10, test_config), "PASS")
+        self.assertEqual(compare_values(12, 10, test_config), "FAIL")
+
+
+class TestCompareValuesBatch(unittest.TestCase):
+    """Test cases for compare_values_batch."""
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_percentage_batch(self):
+        """Test vectorized percentage thresholds match the scalar comparator."""
+        test_config = {"comparisons": {"threshold": {"value": "percentage", "limit": 5}}}
+        sources = [104, 106, 0, 1, 7]
+        targets = [100, 100, 0, 0, 7]
+        expected = [compare_values(s, t, test_config) for s, t in zip(sources, targets)]
+        self.assertEqual(compare_values_batch(sources, targets, test_config), expected)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_absolute_batch(self):
+        """Test vectorized absolute thresholds."""
+        test_config = {"comparisons": {"threshold": {"value": "absolute", "limit": 2}}}
+        self.assertEqual(
+            compare_values_batch([12, 13, 8.5], [10, 10, 10], test_config),
+            ["PASS", "FAIL", "PASS"],
+        )
+
+    def _assert_batch_matches_scalar(self, sources, targets, test_config):
+        expected = [compare_values(s, t, test_config) for s, t in zip(sources, targets)]
+        self.assertEqual(compare_values_batch(sources, targets, test_config), expected)
+
+    def test_numeric_strings_match_scalar(self):
+        """Test that numeric strings are not coerced to floats in the batch path."""
+        absolute = {"comparisons": {"threshold": {"value": "absolute", "limit": 1}}}
+        percentage = {"comparisons": {"threshold": {"value": "percentage", "limit": 10}}}
+        self._assert_batch_matches_scalar(["5"], ["5.5"], absolute)
+        self._assert_batch_matches_scalar(["100"], ["105"], percentage)
+        self.assertEqual(compare_values_batch(["100"], ["105"], percentage), ["FAIL"])
+
+    def test_decimals_match_scalar(self):
+        """Test that Decimals keep their precision instead of rounding to float64."""
+        test_config = {"comparisons": {"threshold": {"value": "absolute", "limit": 0.1}}}
+        self._assert_batch_matches_scalar(
+            [Decimal("12345678901234567.1")], [Decimal("12345678901234567.3")], test_config
+        )
+
+    def test_large_ints_match_scalar(self):
+        """Test that ints beyond float64 precision use the scalar comparator."""
+        test_config = {"comparisons": {"threshold": {"value": "absolute", "limit": 0}}}
+        self._assert_batch_matches_scalar([2 ** 60], [2 ** 60 + 1], test_config)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+    def test_nan_matches_scalar(self):
+        """Test that NaN values give the same result as the scalar comparator."""
+        nan = float("nan")
+        for value in ("absolute", "percentage"):
+            test_config = {"comparisons": {"threshold": {"value": value, "limit": 5}}}
+            self._assert_batch_matches_scalar([nan, nan, 1.0, nan], [nan, 1.0, nan, 0], test_config)
+
+    def test_falls_back_for_non_threshold_modes(self):
+        """Test that modes without a numeric threshold use the scalar comparator."""
+        test_config = {"comparisons": {}}
+        self.assertEqual(
+            compare_values_batch(["a", 1], ["a", 2], test_config),
+            ["PASS", "FAIL"],
+        )
+
+    def test_length_mismatch_raises(self):
+        """Test that sequences of different length are rejected."""
+        with self.assertRaises(ValueError):
+            compare_values_batch([1, 2], [1], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
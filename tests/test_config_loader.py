@@ -0,0 +1,106 @@
+"""
+Tests for config loading and parsed-config caching.
+"""
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+from dataqe_framework import config_loader
+from dataqe_framework.config_loader import load_config, compile_config, COMPILED_SUFFIX
+
+
+class TestLoadConfigCache(unittest.TestCase):
+    """Test cases for the load_config parse cache."""
+
+    def setUp(self):
+        config_loader._CONFIG_CACHE.clear()
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
+            f.write("block:\n  host: ${DATAQE_TEST_HOST:localhost}\n")
+            self.config_path = f.name
+
+    def tearDown(self):
+        os.unlink(self.config_path)
+        config_loader._CONFIG_CACHE.clear()
+
+    def test_repeat_load_returns_shared_frozen_config(self):
+        """Test that repeat loads share one read-only config object."""
+        first = load_config(self.config_path)
+        with self.assertRaises(TypeError):
+            first["block"]["host"] = "mutated"
+
+        second = load_config(self.config_path)
+        self.assertIs(second, first)
+        self.assertEqual(second["block"]["host"], "localhost")
+
+    def test_env_change_invalidates_cache(self):
+        """Test that changing a referenced env var forces a re-parse."""
+        self.assertEqual(load_config(self.config_path)["block"]["host"], "localhost")
+
+        with patch.dict(os.environ, {"DATAQE_TEST_HOST": "db.internal"}):
+            self.assertEqual(load_config(self.config_path)["block"]["host"], "db.internal")
+
+    def test_file_change_invalidates_cache(self):
+        """Test that rewriting the file forces a re-parse."""
+        load_config(self.config_path)
+
+        with open(self.config_path, "w") as f:
+            f.write("block:\n  host: changed-host.example\n")
+
+        self.assertEqual(load_config(self.config_path)["block"]["host"], "changed-host.example")
+
+
+class TestCompiledConfig(unittest.TestCase):
+    """Test cases for compile_config and loading compiled configs."""
+
+    def setUp(self):
+        config_loader._CONFIG_CACHE.clear()
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
+            f.write("block:\n  host: ${DATAQE_TEST_HOST:localhost}\n  port: 3306\n")
+            self.config_path = f.name
+        self.compiled_path = self.config_path + COMPILED_SUFFIX
+
+    def tearDown(self):
+        for path in (self.config_path, self.compiled_path):
+            if os.path.exists(path):
+                os.unlink(path)
+        config_loader._CONFIG_CACHE.clear()
+
+    def test_compiled_config_used_instead_of_yaml(self):
+        """Test that a valid compiled config is loaded without parsing YAML."""
+        self.assertEqual(compile_config(self.config_path), self.compiled_path)
+        self.assertEqual(oct(os.stat(self.compiled_path).st_mode)[-3:], "600")
+
+        with patch.object(config_loader, "_parse_config_file") as mock_parse:
+            config = load_config(self.config_path)
+
+        mock_parse.assert_not_called()
+        self.assertEqual(config["block"]["host"], "localhost")
+        self.assertEqual(config["block"]["port"], 3306)
+
+    def test_compiled_config_ignored_when_env_changes(self):
+        """Test that a compiled config is bypassed when a referenced env var changes."""
+        compile_config(self.config_path)
+
+        with patch.dict(os.environ, {"DATAQE_TEST_HOST": "db.internal"}):
+            self.assertEqual(load_config(self.config_path)["block"]["host"], "db.internal")
+
+    def test_compiled_config_ignored_when_yaml_changes(self):
+        """Test that a compiled config is bypassed after the YAML file is edited."""
+        compile_config(self.config_path)
+
+        with open(self.config_path, "w") as f:
+            f.write("block:\n  host: changed-host.example\n")
+
+        self.assertEqual(load_config(self.config_path)["block"]["host"], "changed-host.example")
+
+    def test_compile_rejects_unsupported_values(self):
+        """Test that configs with values marshal cannot store are rejected."""
+        with open(self.config_path, "w") as f:
+            f.write("block:\n  released: 2024-01-01\n")
+
+        with self.assertRaises(ValueError):
+            compile_config(self.config_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Tests for database connector query execution.
+"""
+
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+from dataqe_framework.connectors import bigquery_connector, mysql_connector, close_all
+from dataqe_framework.connectors.bigquery_connector import BigQueryConnector
+from dataqe_framework.connectors.mysql_connector import MySQLConnector
+
+
+class TestBigQueryConnectorResults:
+    """Tests for BigQueryConnector result conversion."""
+
+    def _connector_with_results(self, results):
+        with patch.dict(os.environ, {'SPRING_PROFILES_ACTIVE': 'MYLOCAL'}):
+            connector = BigQueryConnector({"project_id": "test-project"})
+        connector.client = MagicMock()
+        connector.client.query.return_value.result.return_value = results
+        return connector
+
+    def test_execute_query_uses_arrow_when_available(self):
+        """Test that rows are converted through Arrow when pyarrow is installed."""
+        results = MagicMock()
+        results.to_arrow.return_value.to_pylist.return_value = [{"cnt": 5}]
+        connector = self._connector_with_results(results)
+
+        with patch.object(bigquery_connector, "_HAS_PYARROW", True):
+            assert connector.execute_query("SELECT 5 AS cnt") == [{"cnt": 5}]
+
+        results.to_arrow.assert_called_once_with(create_bqstorage_client=True)
+
+    def test_execute_query_falls_back_to_row_dicts(self):
+        """Test that rows are converted one by one when pyarrow is missing."""
+        connector = self._connector_with_results([{"cnt": 5}, {"cnt": 6}])
+
+        with patch.object(bigquery_connector, "_HAS_PYARROW", False):
+            assert connector.execute_query("SELECT cnt") == [{"cnt": 5}, {"cnt": 6}]
+
+    def test_execute_query_arrow_returns_table(self):
+        """Test that execute_query_arrow returns the Arrow table unchanged."""
+        results = MagicMock()
+        connector = self._connector_with_results(results)
+
+        assert connector.execute_query_arrow("SELECT 1") is results.to_arrow.return_value
+
+
+class TestConnectionReuse:
+    """Tests for process-wide client and connection reuse."""
+
+    def setup_method(self):
+        bigquery_connector._CLIENTS.clear()
+        mysql_connector._IDLE_CONNECTIONS.clear()
+
+    def teardown_method(self):
+        bigquery_connector._CLIENTS.clear()
+        mysql_connector._IDLE_CONNECTIONS.clear()
+
+    def test_bigquery_connectors_share_client(self):
+        """Test that connectors with the same settings share one client."""
+        with patch.dict(os.environ, {'SPRING_PROFILES_ACTIVE': 'MYLOCAL'}):
+            first = BigQueryConnector({"project_id": "test-project"})
+            second = BigQueryConnector({"project_id": "test-project"})
+
+        with patch.object(bigquery_connector, "bigquery") as mock_bigquery, \
+                patch.object(bigquery_connector, "service_account"):
+            mock_client = mock_bigquery.Client
+            first.connect()
+            first.close()
+            second.connect()
+
+        mock_client.assert_called_once()
+        assert second.client is mock_client.return_value
+
+    def test_mysql_connection_returned_to_pool_on_close(self):
+        """Test that a released MySQL connection is reused by the next connector."""
+        params = dict(host="db", port=3306, user="u", password="p", database="d")
+        first = MySQLConnector(**params)
+        second = MySQLConnector(**params)
+
+        with patch.object(mysql_connector, "pymysql") as mock_pymysql:
+            mock_connect = mock_pymysql.connect
+            first.connect()
+            connection = first.connection
+            first.close()
+            second.connect()
+
+        mock_connect.assert_called_once()
+        connection.rollback.assert_called_once()
+        connection.ping.assert_called_once_with(reconnect=True)
+        assert second.connection is connection
+
+    def test_mysql_connection_closed_when_rollback_fails(self):
+        """Test that a connection whose rollback fails is closed instead of pooled."""
+        connector = MySQLConnector(host="db", port=3306, user="u", password="p", database="d")
+
+        with patch.object(mysql_connector, "pymysql"):
+            connector.connect()
+        connection = connector.connection
+        connection.rollback.side_effect = Exception("server has gone away")
+
+        connector.close()
+
+        connection.close.assert_called_once()
+        assert connector.connection is None
+        assert not mysql_connector._IDLE_CONNECTIONS
+
+    def test_mysql_connections_not_shared_while_in_use(self):
+        """Test that two open connectors never share a MySQL connection."""
+        params = dict(host="db", port=3306, user="u", password="p", database="d")
+        first = MySQLConnector(**params)
+        second = MySQLConnector(**params)
+
+        with patch.object(mysql_connector, "pymysql") as mock_pymysql:
+            mock_pymysql.connect.side_effect = [MagicMock(), MagicMock()]
+            first.connect()
+            second.connect()
+
+        assert first.connection is not second.connection
+
+    def test_close_all_closes_pooled_connections_and_clients(self):
+        """Test that close_all empties both pools and closes what they hold."""
+        connection = MagicMock()
+        client = MagicMock()
+        mysql_connector._IDLE_CONNECTIONS[("db",)] = [connection]
+        bigquery_connector._CLIENTS[("test-project",)] = client
+
+        close_all()
+
+        connection.close.assert_called_once()
+        client.close.assert_called_once()
+        assert not mysql_connector._IDLE_CONNECTIONS
+        assert not bigquery_connector._CLIENTS
+
+
+class TestMySQLConnectorStreaming:
+    """Tests for MySQLConnector streamed query results."""
+
+    def _connector(self):
+        connector = MySQLConnector(host="db", port=3306, user="u", password="p", database="d")
+        connector.connection = MagicMock()
+        return connector
+
+    def test_stream_fetches_in_batches(self):
+        """Test that streamed rows are read with fetchmany until exhausted."""
+        connector = self._connector()
+        cursor = connector.connection.cursor.return_value
+        cursor.fetchmany.side_effect = [[{"id": 1}, {"id": 2}], [{"id": 3}], []]
+
+        with patch.object(mysql_connector, "pymysql") as mock_pymysql:
+            rows = connector.execute_query("SELECT id FROM t", stream=True)
+            connector.connection.cursor.assert_called_once_with(mock_pymysql.cursors.SSDictCursor)
+
+        assert list(rows) == [{"id": 1}, {"id": 2}, {"id": 3}]
+        cursor.fetchmany.assert_called_with(MySQLConnector.STREAM_BATCH_SIZE)
+        cursor.close.assert_called_once()
+
+    def test_stream_raises_execution_errors_immediately(self):
+        """Test that query errors surface from execute_query, not on iteration."""
+        connector = self._connector()
+        cursor = connector.connection.cursor.return_value
+        cursor.execute.side_effect = RuntimeError("syntax error")
+
+        with patch.object(mysql_connector, "pymysql"):
+            with pytest.raises(RuntimeError):
+                connector.execute_query("SELEC 1", stream=True)
+
+        cursor.close.assert_called_once()
+
+    def test_default_returns_fetchall_list(self):
+        """Test that execute_query keeps fetchall semantics by default."""
+        connector = self._connector()
+        cursor = connector.connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [{"cnt": 3}]
+
+        assert connector.execute_query("SELECT 3 AS cnt") == [{"cnt": 3}]
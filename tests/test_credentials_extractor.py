@@ -0,0 +1,198 @@
+"""
+Tests for CredentialsExtractor profile and credential extraction helpers.
+"""
+import gc
+import unittest
+import json
+import os
+import tempfile
+import weakref
+from unittest.mock import MagicMock, patch
+from dataqe_framework import credentials_extractor
+from dataqe_framework.credentials_extractor import CredentialsExtractor
+
+
+class TestGetProfile(unittest.TestCase):
+    """Test cases for the cached get_profile lookup."""
+
+    def setUp(self):
+        CredentialsExtractor.reset_profile_cache()
+
+    def tearDown(self):
+        CredentialsExtractor.reset_profile_cache()
+
+    def test_profile_is_lowercased(self):
+        """Test that the profile from the environment is lowercased."""
+        with patch.dict(os.environ, {"SPRING_PROFILES_ACTIVE": "GCPQA"}):
+            self.assertEqual(CredentialsExtractor.get_profile(), "gcpqa")
+
+    def test_profile_defaults_to_local(self):
+        """Test that a missing env var falls back to the local profile."""
+        with patch.dict(os.environ, clear=True):
+            self.assertEqual(CredentialsExtractor.get_profile(), "mylocal")
+
+    def test_profile_is_cached_until_reset(self):
+        """Test that env changes are only seen after reset_profile_cache."""
+        with patch.dict(os.environ, {"SPRING_PROFILES_ACTIVE": "gcpqa"}):
+            self.assertEqual(CredentialsExtractor.get_profile(), "gcpqa")
+
+        with patch.dict(os.environ, {"SPRING_PROFILES_ACTIVE": "gcpprod"}):
+            self.assertEqual(CredentialsExtractor.get_profile(), "gcpqa")
+            CredentialsExtractor.reset_profile_cache()
+            self.assertEqual(CredentialsExtractor.get_profile(), "gcpprod")
+
+
+class TestExtractMysqlConfig(unittest.TestCase):
+    """Test cases for extract_mysql_config."""
+
+    def setUp(self):
+        CredentialsExtractor.clear_caches()
+        self.config_details = MagicMock()
+        self.config_details.data = {
+            "mysql": {
+                "ventana": {"db_host": "db.internal", "db_user": "qe", "db_password": "secret"},
+                "nopass": {"db_host": "db.internal", "db_user": "qe"},
+            }
+        }
+
+    def tearDown(self):
+        CredentialsExtractor.clear_caches()
+
+    def test_extracts_credentials(self):
+        """Test that credentials are built with the default port."""
+        credentials = CredentialsExtractor.extract_mysql_config(self.config_details, "ventana")
+
+        self.assertEqual(credentials, {
+            "host": "db.internal", "port": 3306, "user": "qe",
+            "password": "secret", "database": "ventana",
+        })
+
+    def test_missing_required_field_raises(self):
+        """Test that a missing password is reported by name."""
+        with self.assertRaisesRegex(ValueError, "password"):
+            CredentialsExtractor.extract_mysql_config(self.config_details, "nopass")
+
+    def test_repeat_extraction_is_cached(self):
+        """Test that repeat calls reuse the first extraction but return fresh dicts."""
+        first = CredentialsExtractor.extract_mysql_config(self.config_details, "ventana")
+        first["host"] = "mutated"
+        self.config_details.data["mysql"]["ventana"]["db_host"] = "changed"
+
+        second = CredentialsExtractor.extract_mysql_config(self.config_details, "ventana")
+
+        self.assertEqual(second["host"], "db.internal")
+
+
+class TestExtractBigQueryConfig(unittest.TestCase):
+    """Test cases for extract_bigquery_config and extract_service_account."""
+
+    def setUp(self):
+        CredentialsExtractor.clear_caches()
+        self.config_details = MagicMock()
+        self.config_details.data = {
+            "bigquery": {"myproject": {"datasets": {"ventana": {"project_id": "prj-ventana"}}}},
+            "gcp": {"qe-sa": '{"type": "service_account"}'},
+        }
+
+    def tearDown(self):
+        CredentialsExtractor.clear_caches()
+
+    def test_bigquery_config_is_cached_per_config_object(self):
+        """Test that repeat lookups are cached and keyed on the config object."""
+        first = CredentialsExtractor.extract_bigquery_config(self.config_details, "myproject", "ventana")
+        self.config_details.data["bigquery"]["myproject"]["datasets"]["ventana"]["project_id"] = "changed"
+
+        self.assertEqual(
+            CredentialsExtractor.extract_bigquery_config(self.config_details, "myproject", "ventana"),
+            first
+        )
+        self.assertEqual(first["location"], "us-central1")
+
+        other = MagicMock()
+        other.data = self.config_details.data
+        self.assertEqual(
+            CredentialsExtractor.extract_bigquery_config(other, "myproject", "ventana")["project_id"],
+            "changed"
+        )
+
+    def test_index_built_once_per_config_object(self):
+        """Test that lookups for different datasets share one credentials index."""
+        datasets = self.config_details.data["bigquery"]["myproject"]["datasets"]
+        datasets["ventanaqe"] = {"project_id": "prj-ventanaqe", "location": "US"}
+
+        with patch("dataqe_framework.credentials_extractor._NormalizedCreds",
+                   wraps=credentials_extractor._NormalizedCreds) as mock_index:
+            CredentialsExtractor.extract_bigquery_config(self.config_details, "myproject", "ventana")
+            qe = CredentialsExtractor.extract_bigquery_config(self.config_details, "myproject", "ventanaqe")
+
+        mock_index.assert_called_once()
+        self.assertEqual(qe, {"project_id": "prj-ventanaqe", "dataset_id": "ventanaqe", "location": "US"})
+
+    def test_index_released_with_config_object(self):
+        """Test that the cache does not keep config objects or their credentials alive."""
+        CredentialsExtractor.extract_service_account(self.config_details, "qe-sa")
+        config_ref = weakref.ref(self.config_details)
+
+        self.config_details = None
+        gc.collect()
+
+        self.assertIsNone(config_ref())
+        self.assertEqual(len(credentials_extractor._CREDS_INDEX), 0)
+
+    def test_missing_dataset_is_not_cached(self):
+        """Test that lookup errors are raised every time."""
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                CredentialsExtractor.extract_bigquery_config(self.config_details, "myproject", "missing")
+
+    def test_service_account_is_cached(self):
+        """Test that service account extraction is cached until clear_caches."""
+        self.assertEqual(
+            CredentialsExtractor.extract_service_account(self.config_details, "qe-sa"),
+            '{"type": "service_account"}'
+        )
+        self.config_details.data["gcp"]["qe-sa"] = "rotated"
+        self.assertEqual(
+            CredentialsExtractor.extract_service_account(self.config_details, "qe-sa"),
+            '{"type": "service_account"}'
+        )
+
+        CredentialsExtractor.clear_caches()
+        self.assertEqual(CredentialsExtractor.extract_service_account(self.config_details, "qe-sa"), "rotated")
+
+
+class TestSaveServiceAccountJson(unittest.TestCase):
+    """Test cases for save_service_account_json."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "sa.json")
+
+    def tearDown(self):
+        if os.path.exists(self.output_path):
+            os.unlink(self.output_path)
+        os.rmdir(self.temp_dir)
+
+    def test_dict_key_written_compact_and_owner_only(self):
+        """Test that dict keys are written as compact JSON with 0o600 permissions."""
+        CredentialsExtractor.save_service_account_json({"type": "service_account"}, self.output_path)
+
+        with open(self.output_path) as f:
+            self.assertEqual(f.read(), '{"type":"service_account"}')
+        self.assertEqual(oct(os.stat(self.output_path).st_mode)[-3:], "600")
+
+    def test_existing_file_permissions_are_tightened(self):
+        """Test that overwriting a world-readable file restricts it to the owner."""
+        with open(self.output_path, "w") as f:
+            f.write("old")
+        os.chmod(self.output_path, 0o644)
+
+        CredentialsExtractor.save_service_account_json('{"type": "service_account"}', self.output_path)
+
+        with open(self.output_path) as f:
+            self.assertEqual(json.load(f), {"type": "service_account"})
+        self.assertEqual(oct(os.stat(self.output_path).st_mode)[-3:], "600")
+
+
+if __name__ == "__main__":
+    unittest.main()
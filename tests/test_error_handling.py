@@ -3,10 +3,13 @@ Tests for error handling and invalid test marking features.
 """
 import unittest
 import tempfile
+import threading
+import time
 import os
 from unittest.mock import MagicMock, patch
 from dataqe_framework.executor import ValidationExecutor, _should_skip_test
-from dataqe_framework.reporter import ExecutionSummary
+from dataqe_framework import executor as executor_module
+from dataqe_framework.reporter import ConsoleReporter, ExecutionSummary, ExecutionMetadata
 from dataqe_framework.preprocessor import QueryPreprocessor
 
 
@@ -67,6 +70,111 @@ class TestExecutionSummaryErrorHandling(unittest.TestCase):
         self.assertEqual(summary.error, 1)
         self.assertEqual(summary.skipped, 1)
 
+    def test_summary_counts_critical_failures_and_time(self):
+        """Test that critical failures and total time are tallied, tolerating missing severity."""
+        results = [
+            {"status": "FAIL", "severity": "Critical", "execution_time_ms": 10},
+            {"status": "FAIL", "severity": None, "execution_time_ms": 20},
+            {"status": "PASS", "severity": "critical", "execution_time_ms": 30},
+            {"status": "INVALID"},
+        ]
+        summary = ExecutionSummary(results)
+        self.assertEqual(summary.critical_failed, 1)
+        self.assertEqual(summary.invalid, 1)
+        self.assertEqual(summary.total_execution_time_ms, 60)
+
+    def test_percentages(self):
+        """Test pass and fail percentages, including an empty result set."""
+        summary = ExecutionSummary([{"status": "PASS"}, {"status": "FAIL"}, {"status": "FAIL"}, {"status": "ERROR"}])
+        self.assertEqual(summary.pass_percentage(), 25.0)
+        self.assertEqual(summary.fail_percentage(), 50.0)
+
+        empty = ExecutionSummary([])
+        self.assertEqual(empty.pass_percentage(), 0.0)
+        self.assertEqual(empty.fail_percentage(), 0.0)
+
+    def test_format_duration_is_static(self):
+        """Test that format_duration works without building a summary."""
+        self.assertEqual(ExecutionSummary.format_duration(83456), "1m 23s 456ms")
+        self.assertEqual(ExecutionSummary.format_duration(1500), "1s 500ms")
+        self.assertEqual(ExecutionSummary.format_duration(12.7), "12ms")
+
+    def test_format_duration_memoizes_whole_milliseconds(self):
+        """Test that durations in the same millisecond share one cached string."""
+        from dataqe_framework.reporter import _format_whole_ms
+
+        _format_whole_ms.cache_clear()
+        self.assertEqual(ExecutionSummary.format_duration(1500.2), "1s 500ms")
+        self.assertEqual(ExecutionSummary.format_duration(1500.9), "1s 500ms")
+        self.assertEqual(_format_whole_ms.cache_info().hits, 1)
+
+    def test_metadata_timestamp_follows_reassignment(self):
+        """Test that the cached timestamp string tracks execution_timestamp."""
+        from datetime import datetime
+
+        metadata = ExecutionMetadata("config.yml", ["block1"], execution_timestamp=datetime(2024, 1, 2, 3, 4, 5))
+        self.assertEqual(metadata.get_timestamp_str(), "2024-01-02 03:04:05")
+        self.assertIs(metadata.get_timestamp_str(), metadata.get_timestamp_str())
+
+        metadata.execution_timestamp = datetime(2025, 6, 7, 8, 9, 10)
+        self.assertEqual(metadata.get_timestamp_str(), "2025-06-07 08:09:10")
+
+
+class TestConsoleReporterErrorHandling(unittest.TestCase):
+    """Test cases for per-test console reporting."""
+
+    def setUp(self):
+        self.reporter = ConsoleReporter()
+        self.original_level = self.reporter.logger.level
+
+    def tearDown(self):
+        self.reporter.logger.setLevel(self.original_level)
+
+    def test_reports_error_details(self):
+        """Test that errored tests are logged at ERROR with type and message."""
+        result = {"status": "ERROR", "execution_time_ms": 1500, "error_occurred": True,
+                  "error_type": "ValueError", "error_message": "bad sql"}
+
+        with self.assertLogs(self.reporter.logger, level="INFO") as logs:
+            self.reporter.report_test_execution("test_1", result)
+
+        self.assertEqual(logs.records[0].levelname, "ERROR")
+        self.assertEqual(
+            logs.records[0].getMessage(),
+            "Test: test_1 - Status: ERROR (Execution time: 1s 500ms)\n  └─ ERROR: ValueError - bad sql"
+        )
+
+    def test_filtered_messages_are_not_formatted(self):
+        """Test that passing tests skip duration formatting when INFO is disabled."""
+        self.reporter.logger.setLevel("WARNING")
+
+        with patch.object(ExecutionSummary, "format_duration") as mock_format:
+            self.reporter.report_test_execution("test_1", {"status": "PASS", "execution_time_ms": 5})
+
+        mock_format.assert_not_called()
+
+    def test_summary_lines(self):
+        """Test that the execution summary is logged with counts, percentages and total time."""
+        summary = ExecutionSummary([
+            {"status": "PASS", "execution_time_ms": 1000},
+            {"status": "FAIL", "execution_time_ms": 500},
+            {"status": "ERROR", "execution_time_ms": 0},
+        ])
+
+        with self.assertLogs(self.reporter.logger, level="INFO") as logs:
+            self.reporter.report_summary(summary)
+
+        messages = [record.getMessage() for record in logs.records]
+        self.assertEqual(messages[3:10], [
+            "Total Test Cases: 3",
+            "Passed: 1 (33.3%)",
+            "Failed: 1 (33.3%)",
+            "Errors: 1",
+            "Invalid: 0",
+            "Skipped: 0",
+            "Total Execution Time: 1s 500ms",
+        ])
+
 
 class TestValidationExecutorErrorHandling(unittest.TestCase):
     """Test cases for ValidationExecutor error handling."""
@@ -169,6 +277,293 @@ class TestValidationExecutorErrorHandling(unittest.TestCase):
         self.assertIsNone(result["source_value"])
         self.assertIsNone(result["target_value"])
 
+    def test_result_timings_are_consistent(self):
+        """Test that test duration covers the query and comparison durations."""
+        mock_connector = MagicMock()
+        mock_connector.execute_query.return_value = [{"cnt": 1}]
+
+        executor = ValidationExecutor({}, {}, [{"TEST": {"source": {"query": "SELECT 1"}}}])
+        executor.source_connector = mock_connector
+
+        result = executor.run()[0]
+
+        self.assertLessEqual(result["start_time"], result["end_time"])
+        self.assertGreaterEqual(
+            result["execution_time_ms"],
+            result["source_query_time_ms"] + result["comparison_time_ms"]
+        )
+
+
+    def test_target_error_reported_when_source_succeeds(self):
+        """Test that a target query error is reported after a successful source."""
+        test_cases = [
+            {
+                "TEST": {
+                    "source": {"query": "SELECT 1"},
+                    "target": {"query": "SELECT * FROM bad_table"},
+                    "comparisons": {}
+                }
+            }
+        ]
+
+        source_connector = MagicMock()
+        source_connector.execute_query.return_value = [{"cnt": 1}]
+        target_connector = MagicMock()
+        target_connector.execute_query.side_effect = RuntimeError("Target table missing")
+
+        executor = ValidationExecutor({}, {}, test_cases)
+        executor.source_connector = source_connector
+        executor.target_connector = target_connector
+
+        result = executor.run()[0]
+
+        self.assertEqual(result["status"], "ERROR")
+        self.assertEqual(result["error_type"], "RuntimeError")
+        self.assertEqual(result["source_value"], 1)
+        self.assertIsNone(result["target_value"])
+
+    def test_source_error_takes_precedence_over_target(self):
+        """Test that a source error is reported even though the target ran concurrently."""
+        test_cases = [
+            {
+                "TEST": {
+                    "source": {"query": "SELECT * FROM bad_table"},
+                    "target": {"query": "SELECT 1"},
+                    "comparisons": {}
+                }
+            }
+        ]
+
+        source_connector = MagicMock()
+        source_connector.execute_query.side_effect = ValueError("Source table missing")
+        target_connector = MagicMock()
+        target_connector.execute_query.return_value = [{"cnt": 1}]
+
+        executor = ValidationExecutor({}, {}, test_cases)
+        executor.source_connector = source_connector
+        executor.target_connector = target_connector
+
+        result = executor.run()[0]
+
+        self.assertEqual(result["error_type"], "ValueError")
+        self.assertIsNone(result["target_value"])
+        self.assertEqual(result["target_query_time_ms"], 0.0)
+
+    def test_source_and_target_queries_overlap(self):
+        """Test that the target query runs while the source query is in flight."""
+        test_cases = [
+            {
+                "TEST": {
+                    "source": {"query": "SELECT 1"},
+                    "target": {"query": "SELECT 1"},
+                    "comparisons": {}
+                }
+            }
+        ]
+
+        target_started = threading.Event()
+
+        def source_query(query):
+            # Only returns promptly if the target query was issued concurrently
+            self.assertTrue(target_started.wait(timeout=5))
+            return [{"cnt": 1}]
+
+        def target_query(query):
+            target_started.set()
+            return [{"cnt": 1}]
+
+        source_connector = MagicMock()
+        source_connector.execute_query.side_effect = source_query
+        target_connector = MagicMock()
+        target_connector.execute_query.side_effect = target_query
+
+        executor = ValidationExecutor({}, {}, test_cases)
+        executor.source_connector = source_connector
+        executor.target_connector = target_connector
+
+        result = executor.run()[0]
+
+        self.assertEqual(result["status"], "PASS")
+
+    def test_in_flight_target_query_finishes_after_source_error(self):
+        """Test that a failed source waits for its in-flight target query before the next test."""
+        test_cases = [
+            {"TEST_1": {"source": {"query": "SELECT 1"}, "target": {"query": "SELECT 1"}, "comparisons": {}}},
+            {"TEST_2": {"source": {"query": "SELECT 2"}, "target": {"query": "SELECT 2"}, "comparisons": {}}},
+        ]
+        source_failed = threading.Event()
+        first_target_done = threading.Event()
+        target_calls = []
+
+        def source_query(query):
+            if query == "SELECT 1":
+                source_failed.set()
+                raise ValueError("Source table missing")
+            # The first test's target query must be finished before this test starts
+            self.assertTrue(first_target_done.is_set())
+            return [{"cnt": 2}]
+
+        def target_query(query):
+            target_calls.append(query)
+            if query == "SELECT 1":
+                source_failed.wait(timeout=5)
+                time.sleep(0.05)
+                first_target_done.set()
+                raise RuntimeError("Target connection lost")
+            return [{"cnt": 2}]
+
+        source_connector = MagicMock()
+        source_connector.execute_query.side_effect = source_query
+        target_connector = MagicMock()
+        target_connector.execute_query.side_effect = target_query
+
+        executor = ValidationExecutor({}, {}, test_cases)
+        executor.source_connector = source_connector
+        executor.target_connector = target_connector
+
+        with self.assertLogs("dataqe_framework.executor", level="WARNING") as logs:
+            first, second = executor.run()
+
+        self.assertEqual(first["error_type"], "ValueError")
+        self.assertEqual(second["status"], "PASS")
+        self.assertEqual(target_calls, ["SELECT 1", "SELECT 2"])
+        self.assertTrue(any("Target connection lost" in line for line in logs.output))
+
+    def test_parallel_io_disabled_runs_target_on_caller_thread(self):
+        """Test that parallel_io=False runs both queries on the calling thread."""
+        test_cases = [
+            {
+                "TEST": {
+                    "source": {"query": "SELECT 1"},
+                    "target": {"query": "SELECT 1"},
+                    "comparisons": {}
+                }
+            }
+        ]
+        threads = []
+
+        def record_thread(query):
+            threads.append(threading.current_thread())
+            return [{"cnt": 1}]
+
+        source_connector = MagicMock()
+        source_connector.execute_query.side_effect = record_thread
+        target_connector = MagicMock()
+        target_connector.execute_query.side_effect = record_thread
+
+        executor = ValidationExecutor({}, {}, test_cases, parallel_io=False)
+        executor.source_connector = source_connector
+        executor.target_connector = target_connector
+
+        with patch("dataqe_framework.executor.ThreadPoolExecutor") as mock_pool:
+            result = executor.run()[0]
+
+        mock_pool.assert_not_called()
+
+        self.assertEqual(result["status"], "PASS")
+        self.assertEqual(threads, [threading.current_thread()] * 2)
+
+    def test_comparator_built_once_per_test(self):
+        """Test that each test's comparator is built once and reused across runs."""
+        test_cases = [
+            {"T1": {"source": {"query": "SELECT 1", "expected": ">=1"}}},
+            {"T2": {"source": {"query": "SELECT 2", "expected": ">=1"}}},
+        ]
+        mock_connector = MagicMock()
+        mock_connector.execute_query.return_value = [{"result": 1}]
+
+        executor = ValidationExecutor({}, {}, test_cases)
+        executor.source_connector = mock_connector
+        executor.target_connector = None
+
+        with patch("dataqe_framework.executor.build_comparator",
+                   wraps=executor_module.build_comparator) as mock_build:
+            first = executor.run()
+            second = executor.run()
+
+        self.assertEqual(mock_build.call_count, 2)
+        self.assertEqual([r["status"] for r in first + second], ["PASS"] * 4)
+
+    def test_processed_query_is_cached(self):
+        """Test that a repeated query is only preprocessed once."""
+        executor = ValidationExecutor({}, {}, [])
+        preprocessor = MagicMock()
+        preprocessor.replace_dataset_placeholders.return_value = ("SELECT 2", {"A": "b"})
+        preprocessor.replace_release_labels.return_value = ("SELECT 3", {})
+        preprocessor.release_labels_cache = []
+
+        first = executor._process_query_with_preprocessor("SELECT 1", MagicMock(), preprocessor)
+        second = executor._process_query_with_preprocessor("SELECT 1", MagicMock(), preprocessor)
+
+        self.assertEqual(first[0], "SELECT 3")
+        self.assertIs(second, first)
+        preprocessor.replace_dataset_placeholders.assert_called_once()
+
+    def test_failed_preprocessing_is_not_cached(self):
+        """Test that a preprocessing error is retried on the next query."""
+        executor = ValidationExecutor({}, {}, [])
+        preprocessor = MagicMock()
+        preprocessor.replace_dataset_placeholders.side_effect = [
+            Exception("lookup failed"), ("SELECT 2", {})
+        ]
+        preprocessor.replace_release_labels.return_value = ("SELECT 2", {})
+        preprocessor.release_labels_cache = []
+
+        first = executor._process_query_with_preprocessor("SELECT 1", MagicMock(), preprocessor)
+        second = executor._process_query_with_preprocessor("SELECT 1", MagicMock(), preprocessor)
+
+        self.assertEqual(first[0], "SELECT 1")
+        self.assertEqual(second[0], "SELECT 2")
+
+    def test_preflight_fetches_mappings_once_per_side(self):
+        """Test that dataset mappings are fetched once for each side with release placeholders."""
+        test_cases = [
+            {"T1": {"source": {"query": "SELECT * FROM t WHERE r = 'SRC_CURR_WEEK'"},
+                    "target": {"query": "SELECT 1"}}},
+            {"T2": {"source": {"query": "SELECT * FROM t WHERE r = 'SRC_PREV_WEEK'"}}},
+        ]
+        executor = ValidationExecutor({}, {}, test_cases)
+        executor.source_connector = MagicMock()
+        executor.target_connector = MagicMock()
+        executor.source_preprocessor = MagicMock()
+        executor.source_preprocessor.preprocessor_config = {"config_query_key": "releases"}
+        executor.target_preprocessor = MagicMock()
+        executor.target_preprocessor.preprocessor_config = {"config_query_key": "releases"}
+
+        executor._preflight_mappings()
+
+        executor.source_preprocessor.get_dataset_mappings.assert_called_once_with(
+            "releases", executor.source_connector
+        )
+        executor.target_preprocessor.get_dataset_mappings.assert_not_called()
+
+    def test_preflight_skipped_without_release_placeholders(self):
+        """Test that no mappings query runs when no test uses release label placeholders."""
+        test_cases = [{"T1": {"source": {"query": "SELECT 1"}, "target": {"query": "SELECT 2"}}}]
+        executor = ValidationExecutor({}, {}, test_cases)
+        executor.source_connector = MagicMock()
+        executor.target_connector = MagicMock()
+        executor.source_preprocessor = MagicMock()
+        executor.source_preprocessor.preprocessor_config = {"config_query_key": "releases"}
+        executor.target_preprocessor = MagicMock()
+        executor.target_preprocessor.preprocessor_config = {"config_query_key": "releases"}
+
+        executor._preflight_mappings()
+
+        executor.source_preprocessor.get_dataset_mappings.assert_not_called()
+        executor.target_preprocessor.get_dataset_mappings.assert_not_called()
+
+    def test_preflight_error_does_not_stop_run(self):
+        """Test that a failed preflight lookup is logged and not raised."""
+        executor = ValidationExecutor({}, {}, [{"T1": {"source": {"query": "SELECT 'SRC_CURR_WEEK'"}}}])
+        executor.source_connector = MagicMock()
+        executor.source_preprocessor = MagicMock()
+        executor.source_preprocessor.preprocessor_config = {"config_query_key": "releases"}
+        executor.source_preprocessor.get_dataset_mappings.side_effect = Exception("boom")
+
+        with self.assertLogs("dataqe_framework.executor", level="WARNING"):
+            executor._preflight_mappings()
+
 
 class TestPreprocessorErrorHandling(unittest.TestCase):
     """Test cases for preprocessor file validation."""
@@ -0,0 +1,187 @@
+"""
+Tests for QueryPreprocessor mapping lookups and placeholder replacement.
+"""
+import unittest
+import tempfile
+import os
+import yaml
+from unittest.mock import MagicMock, patch
+from dataqe_framework import preprocessor as preprocessor_module
+from dataqe_framework.preprocessor import QueryPreprocessor
+
+
+class TestDatasetMappingsCache(unittest.TestCase):
+    """Test cases for get_dataset_mappings caching."""
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
+            yaml.dump({"releases": "SELECT source, current_release, previous_release FROM releases"}, f)
+            self.queries_path = f.name
+
+        self.connector = MagicMock()
+        self.connector.execute_query.return_value = [
+            {"source": "bcbsa", "current_release": "bcbsa_export1", "previous_release": "bcbsa_export0"}
+        ]
+
+    def tearDown(self):
+        os.unlink(self.queries_path)
+
+    def test_mappings_query_runs_once_per_key(self):
+        """Test that repeated lookups for the same key reuse the first result."""
+        preprocessor = QueryPreprocessor(self.queries_path, {})
+
+        first = preprocessor.get_dataset_mappings("releases", self.connector)
+        second = preprocessor.get_dataset_mappings("releases", self.connector)
+
+        self.assertEqual(first, second)
+        self.connector.execute_query.assert_called_once()
+
+    def test_process_query_reuses_mappings(self):
+        """Test that processing many queries runs the preprocessor query once."""
+        preprocessor = QueryPreprocessor(self.queries_path, {})
+
+        for _ in range(3):
+            result = preprocessor.process_query(
+                "SELECT * FROM BCBSA_CURR_WEEK", "releases", "bcbsa", self.connector
+            )
+            self.assertEqual(result, "SELECT * FROM bcbsa_export1")
+
+        self.connector.execute_query.assert_called_once()
+
+    def test_invalidate_mappings_forces_requery(self):
+        """Test that invalidate_mappings clears the cache."""
+        preprocessor = QueryPreprocessor(self.queries_path, {})
+
+        preprocessor.get_dataset_mappings("releases", self.connector)
+        preprocessor.invalidate_mappings()
+        preprocessor.get_dataset_mappings("releases", self.connector)
+
+        self.assertEqual(self.connector.execute_query.call_count, 2)
+
+    def test_errors_are_not_cached(self):
+        """Test that a failed preprocessor query is retried on the next lookup."""
+        preprocessor = QueryPreprocessor(self.queries_path, {})
+        rows = self.connector.execute_query.return_value
+        self.connector.execute_query.side_effect = [RuntimeError("timeout"), rows]
+
+        with self.assertRaises(RuntimeError):
+            preprocessor.get_dataset_mappings("releases", self.connector)
+
+        mappings = preprocessor.get_dataset_mappings("releases", self.connector)
+        self.assertIn("bcbsa", mappings)
+
+    def test_plain_query_skips_mapping_lookup(self):
+        """Test that a query without release placeholders never runs the preprocessor query."""
+        preprocessor = QueryPreprocessor(self.queries_path, {"config_query_key": "releases"})
+
+        result = preprocessor.replace_release_labels("SELECT COUNT(*) FROM t", self.connector)
+
+        self.assertEqual(result, ("SELECT COUNT(*) FROM t", {}))
+        self.connector.execute_query.assert_not_called()
+        self.assertIsNone(preprocessor.release_labels_cache)
+
+    def test_release_labels_replaced_with_precomputed_placeholders(self):
+        """Test that release labels carry precomputed placeholders and are applied."""
+        preprocessor = QueryPreprocessor(self.queries_path, {"config_query_key": "releases"})
+
+        query, replacements = preprocessor.replace_release_labels(
+            "SELECT * FROM BCBSA_CURR_WEEK.t JOIN BCBSA_PREV_WEEK.t", self.connector
+        )
+
+        self.assertEqual(query, "SELECT * FROM bcbsa_export1.t JOIN bcbsa_export0.t")
+        self.assertEqual(replacements, {
+            "BCBSA_CURR_WEEK": "bcbsa_export1", "BCBSA_PREV_WEEK": "bcbsa_export0"
+        })
+        self.assertEqual(preprocessor.release_labels_cache[0]["curr_placeholder"], "BCBSA_CURR_WEEK")
+
+    def test_process_query_without_source_replaces_all_sources(self):
+        """Test that process_query with no source_name replaces every source's placeholders."""
+        self.connector.execute_query.return_value = [
+            {"source": "bcbsa", "current_release": "bcbsa_export1", "previous_release": "bcbsa_export0"},
+            {"source": "bcbsa_pf", "current_release": "bcbsa_pf_export2", "previous_release": "bcbsa_pf_export1"},
+        ]
+        preprocessor = QueryPreprocessor(self.queries_path, {})
+
+        result = preprocessor.process_query(
+            "SELECT * FROM BCBSA_PF_CURR_WEEK.t JOIN BCBSA_PREV_WEEK.t", "releases", None, self.connector
+        )
+
+        self.assertEqual(result, "SELECT * FROM bcbsa_pf_export2.t JOIN bcbsa_export0.t")
+
+
+class TestPreprocessorQueriesCache(unittest.TestCase):
+    """Test cases for caching parsed preprocessor query files."""
+
+    def setUp(self):
+        preprocessor_module._load_yaml_cached.cache_clear()
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
+            f.write("releases: SELECT 1\n")
+            self.queries_path = f.name
+
+    def tearDown(self):
+        os.unlink(self.queries_path)
+        preprocessor_module._load_yaml_cached.cache_clear()
+
+    def test_file_parsed_once_for_many_preprocessors(self):
+        """Test that source and target preprocessors share one parse of the file."""
+        with patch.object(preprocessor_module, "load_yaml_file",
+                          wraps=preprocessor_module.load_yaml_file) as mock_load:
+            first = QueryPreprocessor(self.queries_path, {})
+            second = QueryPreprocessor(self.queries_path, {})
+
+        mock_load.assert_called_once()
+        self.assertEqual(second.preprocessor_queries, {"releases": "SELECT 1"})
+        self.assertEqual(first.preprocessor_queries, second.preprocessor_queries)
+
+    def test_file_change_forces_reparse(self):
+        """Test that editing the file is picked up by the next preprocessor."""
+        QueryPreprocessor(self.queries_path, {})
+
+        with open(self.queries_path, "w") as f:
+            f.write("releases: SELECT 2 -- edited\n")
+
+        self.assertEqual(
+            QueryPreprocessor(self.queries_path, {}).preprocessor_queries,
+            {"releases": "SELECT 2 -- edited"}
+        )
+
+
+class TestReplacePlaceholdersInQuery(unittest.TestCase):
+    """Test cases for replace_placeholders_in_query."""
+
+    MAPPINGS = {
+        "bcbsa": {"current_release": "bcbsa_export1", "previous_release": "bcbsa_export0"},
+        "bcbsa_pf": {"current_release": "bcbsa_pf_export2", "previous_release": "bcbsa_pf_export1"},
+    }
+
+    def test_replaces_current_and_previous(self):
+        """Test that both placeholders for a source are replaced."""
+        preprocessor = QueryPreprocessor(None, {})
+        query = "SELECT * FROM BCBSA_CURR_WEEK.t a JOIN BCBSA_PREV_WEEK.t b ON a.id = b.id"
+
+        result = preprocessor.replace_placeholders_in_query(query, "bcbsa", self.MAPPINGS)
+
+        self.assertEqual(
+            result,
+            "SELECT * FROM bcbsa_export1.t a JOIN bcbsa_export0.t b ON a.id = b.id"
+        )
+
+    def test_only_named_source_is_replaced(self):
+        """Test that placeholders of other sources are left untouched."""
+        preprocessor = QueryPreprocessor(None, {})
+        query = "SELECT * FROM BCBSA_PF_CURR_WEEK.t JOIN BCBSA_CURR_WEEK.t"
+
+        result = preprocessor.replace_placeholders_in_query(query, "bcbsa_pf", self.MAPPINGS)
+
+        self.assertEqual(result, "SELECT * FROM bcbsa_pf_export2.t JOIN BCBSA_CURR_WEEK.t")
+
+    def test_query_without_placeholders_unchanged(self):
+        """Test that a query without placeholders is returned as-is."""
+        preprocessor = QueryPreprocessor(None, {})
+        query = "SELECT 1"
+
+        self.assertIs(preprocessor.replace_placeholders_in_query(query, "bcbsa", self.MAPPINGS), query)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -318,6 +318,87 @@ class TestHTMLReporterReplacementDisplay(unittest.TestCase):
             self.assertIn("actual-edw", html_content)
             self.assertIn("<details", html_content)
 
+    def test_html_report_rows_render_values_and_errors(self):
+        """Test that HTML result rows include values, status class and truncated errors."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = HTMLReporter(tmpdir)
+
+            results = [
+                {"test_name": "test_ok", "severity": "high", "source_value": 10,
+                 "target_value": None, "status": "PASS", "execution_time_ms": 5.0},
+                {"test_name": "test_err", "severity": "low", "source_value": None,
+                 "target_value": None, "status": "ERROR", "execution_time_ms": 1.0,
+                 "error_occurred": True, "error_type": "ValueError", "error_message": "x" * 150},
+            ]
+
+            html_content = reporter._build_html(results, ExecutionSummary(results))
+
+            self.assertIn('<tr class="pass"><td>test_ok</td><td>high</td><td>10</td><td>None</td>', html_content)
+            self.assertIn('<tr class="error"><td>test_err</td>', html_content)
+            self.assertIn("ValueError: " + "x" * 97 + "...", html_content)
+
+    def test_html_report_streams_complete_document_to_file(self):
+        """Test that generate_report writes header, rows and closing tags to the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = [
+                {"test_name": "test_ok", "severity": "high", "source_value": 10, "target_value": 10,
+                 "status": "PASS", "execution_time_ms": 1.0},
+            ]
+
+            html_path = HTMLReporter(tmpdir).generate_report(results, ExecutionSummary(results))
+
+            with open(html_path, encoding="utf-8") as f:
+                html_content = f.read()
+
+            self.assertTrue(html_content.startswith("<!DOCTYPE html>"))
+            self.assertIn('<tr class="pass"><td>test_ok</td><td>high</td><td>10</td><td>10</td>', html_content)
+            self.assertTrue(html_content.endswith("</tbody>\n    </table>\n</body>\n</html>\n"))
+
+    def test_reporters_sharing_output_dir_create_it_once(self):
+        """Test that reporters for the same output directory only create it once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = os.path.join(tmpdir, "reports")
+
+            with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+                HTMLReporter(output_dir)
+                CSVReporter(output_dir)
+                FailedExecutionReporter(output_dir)
+
+            mock_mkdir.assert_called_once()
+            self.assertTrue(os.path.isdir(output_dir))
+
+    def test_reporter_recreates_deleted_output_dir(self):
+        """Test that a reporter recreates an output directory removed after an earlier reporter made it."""
+        import shutil
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = os.path.join(tmpdir, "reports")
+            CSVReporter(output_dir)
+            shutil.rmtree(output_dir)
+
+            results = [{"test_name": "test_ok", "status": "PASS", "execution_time_ms": 1.0}]
+            csv_path = CSVReporter(output_dir).generate_report(results, ExecutionSummary(results))
+
+            self.assertTrue(os.path.isfile(csv_path))
+
+    def test_html_report_escapes_cell_values(self):
+        """Test that values containing HTML markup are escaped in result rows."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = HTMLReporter(tmpdir)
+
+            results = [
+                {"test_name": "<script>x</script>", "severity": "high", "source_value": "a & b",
+                 "target_value": '"q"', "status": "ERROR", "execution_time_ms": 1.0,
+                 "error_occurred": True, "error_type": "SQLError", "error_message": "near '<'"},
+            ]
+
+            html_content = reporter._build_html(results, ExecutionSummary(results))
+
+            self.assertNotIn("<script>", html_content)
+            self.assertIn("&lt;script&gt;x&lt;/script&gt;", html_content)
+            self.assertIn("<td>a &amp; b</td><td>&quot;q&quot;</td>", html_content)
+            self.assertIn("SQLError: near &#x27;&lt;&#x27;", html_content)
+
     def test_html_report_shows_dataset_and_release_labels(self):
         """Test that HTML report shows both dataset and release label replacements."""
         from dataqe_framework.reporter import ExecutionMetadata
@@ -441,6 +522,91 @@ class TestCSVReporterReplacementDisplay(unittest.TestCase):
             self.assertIn("REPLACEMENTS", csv_content)
             self.assertIn("EDW_PRCD_PROJECT → actual-edw", csv_content)
 
+    def test_replacements_aggregated_once_per_summary(self):
+        """Test that reporters sharing a summary reuse one replacements aggregate."""
+        from dataqe_framework import reporter as reporter_module
+        from dataqe_framework.reporter import ExecutionMetadata
+
+        results = [
+            {"test_name": "test_1", "status": "PASS", "execution_time_ms": 1.0,
+             "replacements": {"dataset_placeholders": {"EDW_PRCD_PROJECT": "actual-edw"},
+                              "release_labels": {"BQ_CURR_WEEK": "R2024_01"}}},
+            {"test_name": "test_2", "status": "PASS", "execution_time_ms": 1.0,
+             "replacements": {"dataset_placeholders": {"EDW_SRC_PROJECT": "actual-src"}}},
+        ]
+        summary = ExecutionSummary(results)
+        metadata = ExecutionMetadata("config.yml", ["block1"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(reporter_module, "_aggregate_replacements",
+                              wraps=reporter_module._aggregate_replacements) as mock_aggregate:
+                HTMLReporter(tmpdir).generate_report(results, summary, metadata)
+                CSVReporter(tmpdir).generate_report(results, summary, metadata)
+
+        mock_aggregate.assert_called_once_with(results)
+        self.assertEqual(summary.aggregated_replacements(), {
+            "dataset_placeholders": {"EDW_PRCD_PROJECT": "actual-edw", "EDW_SRC_PROJECT": "actual-src"},
+            "release_labels": {"BQ_CURR_WEEK": "R2024_01"},
+        })
+
+    def test_csv_report_result_rows(self):
+        """Test that CSV result rows include error details only for errored tests."""
+        import csv
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = CSVReporter(tmpdir)
+
+            results = [
+                {"test_name": "test_ok", "severity": "high", "source_value": 10,
+                 "target_value": 10, "status": "PASS", "execution_time_ms": 1.5,
+                 "error_type": "Ignored", "error_message": "ignored"},
+                {"test_name": "test_err", "status": "ERROR", "execution_time_ms": 2,
+                 "error_occurred": True, "error_type": "ValueError", "error_message": "bad sql"},
+            ]
+
+            csv_path = reporter.generate_report(results, ExecutionSummary(results))
+
+            with open(csv_path, newline='') as f:
+                rows = list(csv.reader(f))
+
+            self.assertEqual(rows[1], ["test_ok", "high", "10", "10", "PASS", "", "",
+                                       "1.50", "0.00", "0.00", "0.00"])
+            self.assertEqual(rows[2], ["test_err", "N/A", "", "", "ERROR", "ValueError", "bad sql",
+                                       "2.00", "0.00", "0.00", "0.00"])
+
+    def test_csv_row_from_complete_result_matches_defaults_path(self):
+        """Test that executor-shaped results render the same as the per-field fallback."""
+        from dataqe_framework.reporter import _csv_result_row, _csv_result_row_with_defaults
+
+        result = {
+            "test_name": "test_err", "severity": None, "source_value": 1, "target_value": None,
+            "status": "ERROR", "execution_time_ms": 2.5, "source_query_time_ms": 1.0,
+            "target_query_time_ms": 0.5, "comparison_time_ms": 0.0, "error_occurred": True,
+            "error_type": "ValueError", "error_message": "bad sql", "replacements": {},
+        }
+
+        self.assertEqual(_csv_result_row(result), _csv_result_row_with_defaults(result))
+        self.assertEqual(_csv_result_row(result), (
+            "test_err", None, 1, None, "ERROR", "ValueError", "bad sql", "2.50", "1.00", "0.50", "0.00"
+        ))
+
+    def test_csv_report_written_as_utf8(self):
+        """Test that non-ASCII values are written as UTF-8 regardless of locale."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = CSVReporter(tmpdir)
+
+            results = [
+                {"test_name": "test_ünïcode", "severity": "high", "source_value": "café",
+                 "target_value": "café", "status": "PASS", "execution_time_ms": 1.0},
+            ]
+
+            csv_path = reporter.generate_report(results, ExecutionSummary(results))
+
+            with open(csv_path, "rb") as f:
+                content = f.read().decode("utf-8")
+
+            self.assertIn("test_ünïcode,high,café,café,PASS", content)
+
     def test_csv_report_multiple_replacements_semicolon_separated(self):
         """Test that multiple replacements are shown in REPLACEMENTS section."""
         from dataqe_framework.reporter import ExecutionMetadata
@@ -488,6 +654,25 @@ class TestCSVReporterReplacementDisplay(unittest.TestCase):
 class TestFailedExecutionReporterReplacementDisplay(unittest.TestCase):
     """Test that FailedExecutionReporter displays replacements."""
 
+    def test_failed_report_lists_failures_before_errors(self):
+        """Test that failed tests are listed before errored tests and passes are omitted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reporter = FailedExecutionReporter(tmpdir)
+
+            results = [
+                {"test_name": "err_1", "status": "ERROR", "execution_time_ms": 1},
+                {"test_name": "pass_1", "status": "PASS", "execution_time_ms": 1},
+                {"test_name": "fail_1", "status": "FAIL", "execution_time_ms": 1},
+            ]
+
+            html_path = reporter.generate_report(results, ExecutionSummary(results))
+
+            with open(html_path, 'r') as f:
+                html_content = f.read()
+
+            self.assertNotIn("pass_1", html_content)
+            self.assertLess(html_content.index("fail_1"), html_content.index("err_1"))
+
     def test_failed_report_includes_replacements_for_failed_tests(self):
         """Test that failed execution report includes replacements for failed tests."""
         from dataqe_framework.reporter import ExecutionMetadata